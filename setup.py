@@ -9,6 +9,7 @@ setup(
     packages=find_packages(),
     py_modules=['main'],
     install_requires=['click', 'pygame'],
+    python_requires='>=3.10',
     include_package_data=True,
     zip_safe=False,
     entry_points={
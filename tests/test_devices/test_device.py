@@ -43,6 +43,18 @@ class TestSpaceInvadersScene(unittest.TestCase):
         shifter.write(write_value, 0x04)  # write to value
         self.assertEqual(shifter.read(), expected_value)
 
+    def test_shifter_two_writes(self):
+        shifter = Shifter()
+        shifter.write(0xAB, 0x04)
+        shifter.write(0xCD, 0x04)  # register is now 0xCDAB
+
+        shifter.write(0x00, 0x02)
+        self.assertEqual(shifter.read(), 0xCD)
+        shifter.write(0x04, 0x02)
+        self.assertEqual(shifter.read(), 0xDA)
+        shifter.write(0x07, 0x02)
+        self.assertEqual(shifter.read(), 0xD5)
+
     def test_shifter_invalid_port(self):
         shifter = Shifter()
         with self.assertRaises(Exception):
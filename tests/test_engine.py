@@ -25,13 +25,19 @@ class TestEngine(unittest.TestCase):
 
     @unittest.mock.patch("pygame.init")
     @unittest.mock.patch("pygame.display.set_mode")
-    def setUp(self, mock_set_mode, mock_init) -> None:
+    @unittest.mock.patch("pygame.event.set_blocked")
+    @unittest.mock.patch("pygame.event.set_allowed")
+    def setUp(
+        self, mock_set_allowed, mock_set_blocked, mock_set_mode, mock_init
+    ) -> None:
         self.surface = pygame.Surface((800, 600))
 
         mock_set_mode.return_value = self.surface
         mock_init.return_value = None
 
         self.engine = GameManager(scene=MockScene(surface=self.surface))
+        self.mock_set_blocked = mock_set_blocked
+        self.mock_set_allowed = mock_set_allowed
 
     @unittest.mock.patch("pygame.event.get")
     @unittest.mock.patch("pygame.display.update")
@@ -46,3 +52,17 @@ class TestEngine(unittest.TestCase):
 
         mock_update.assert_called_once()
         mock_get.assert_called_once()
+
+    def test_event_filter(self):
+        self.mock_set_blocked.assert_called_once_with(None)
+        self.mock_set_allowed.assert_called_once_with([pygame.QUIT, pygame.KEYDOWN])
+
+    def test_scale_frame(self):
+        frame = pygame.Surface((10, 20))
+        frame.fill((0xFF, 0x00, 0x00))
+
+        surface = self.engine.scale_frame(frame)
+        self.assertEqual(surface.get_size(), (20, 40))
+        self.assertEqual(surface.get_at((19, 39))[:3], (0xFF, 0x00, 0x00))
+        self.assertIs(self.engine.scale_frame(frame), surface)
+        self.assertEqual(self.engine.frame_position, (390, 280))
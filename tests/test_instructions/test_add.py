@@ -136,7 +136,7 @@ class Test_ADD_Instruction(Intel8080_Base):
         self.cpu.registers.A = 0x0F
         self.cpu.registers.B = 0x01
 
-        self.cpu.flags.AC = False
+        self.cpu.flags.A = False
 
         self.cpu.execute_instruction()
 
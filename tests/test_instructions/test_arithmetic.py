@@ -0,0 +1,121 @@
+"""
+Test class for the register arithmetic Instructions: INR, DCR, ADC, SUB, SBB and CMP.
+"""
+
+from tests.base.intel_8080 import Intel8080_Base
+
+REGISTERS = ((0, "B"), (1, "C"), (2, "D"), (3, "E"), (4, "H"), (5, "L"))
+
+
+class Test_Arithmetic_Instructions(Intel8080_Base):
+
+    def run_opcode(self, opcode, a, value, register, flags):
+        self.setUp()
+        self.cpu.write_memory_byte(0x0000, opcode)
+        self.cpu.registers.A = a
+        setattr(self.cpu.registers, register, value)
+        self.cpu.flags._flags = flags
+
+        self.cpu.execute_instruction()
+
+        self.assertEqual(self.cpu.PC, 0x0001)
+
+    def test_inr(self):
+        cases = (
+            (0x0F, 0x10, 0x13),
+            (0xFF, 0x00, 0x57),
+            (0x7F, 0x80, 0x93),
+        )
+        for index, register in (*REGISTERS, (7, "A")):
+            opcode = 0x04 | (index << 0x03)
+            for value, expected, flags in cases:
+                with self.subTest(opcode=f"0x{opcode:02x}", value=value):
+                    self.run_opcode(opcode, value, value, register, 0x03)  # INR
+
+                    self.assertEqual(getattr(self.cpu.registers, register), expected)
+                    self.assertEqual(self.cpu.flags._flags, flags)
+                    self.assertEqual(self.cpu.cycles, 5)
+
+    def test_dcr(self):
+        cases = (
+            (0x01, 0x00, 0x47),
+            (0x00, 0xFF, 0x87),
+            (0x10, 0x0F, 0x07),
+        )
+        for index, register in (*REGISTERS, (7, "A")):
+            opcode = 0x05 | (index << 0x03)
+            for value, expected, flags in cases:
+                with self.subTest(opcode=f"0x{opcode:02x}", value=value):
+                    self.run_opcode(opcode, value, value, register, 0x13)  # DCR
+
+                    self.assertEqual(getattr(self.cpu.registers, register), expected)
+                    self.assertEqual(self.cpu.flags._flags, flags)
+                    self.assertEqual(self.cpu.cycles, 5)
+
+    def test_adc(self):
+        for index, register in REGISTERS:
+            opcode = 0x88 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.run_opcode(opcode, 0x3D, 0x42, register, 0x03)  # ADC register
+
+                self.assertEqual(self.cpu.registers.A, 0x80)
+                self.assertEqual(self.cpu.flags._flags, 0x92)
+                self.assertEqual(self.cpu.cycles, 4)
+
+        self.run_opcode(0x8F, 0x80, 0x80, "A", 0x03)  # ADC A
+
+        self.assertEqual(self.cpu.registers.A, 0x01)
+        self.assertEqual(self.cpu.flags._flags, 0x03)
+        self.assertEqual(self.cpu.cycles, 4)
+
+    def test_sub(self):
+        for index, register in REGISTERS:
+            opcode = 0x90 | index
+            for a, value, expected, flags in (
+                (0x3E, 0x3E, 0x00, 0x56),
+                (0x14, 0x22, 0xF2, 0x93),
+            ):
+                with self.subTest(opcode=f"0x{opcode:02x}", a=a):
+                    self.run_opcode(opcode, a, value, register, 0x03)  # SUB register
+
+                    self.assertEqual(self.cpu.registers.A, expected)
+                    self.assertEqual(self.cpu.flags._flags, flags)
+                    self.assertEqual(self.cpu.cycles, 4)
+
+        self.run_opcode(0x97, 0x55, 0x55, "A", 0x03)  # SUB A
+
+        self.assertEqual(self.cpu.registers.A, 0x00)
+        self.assertEqual(self.cpu.flags._flags, 0x56)
+        self.assertEqual(self.cpu.cycles, 4)
+
+    def test_sbb(self):
+        for index, register in REGISTERS:
+            opcode = 0x98 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.run_opcode(opcode, 0x04, 0x02, register, 0x03)  # SBB register
+
+                self.assertEqual(self.cpu.registers.A, 0x01)
+                self.assertEqual(self.cpu.flags._flags, 0x12)
+                self.assertEqual(self.cpu.cycles, 4)
+
+        self.run_opcode(0x9F, 0x10, 0x10, "A", 0x03)  # SBB A
+
+        self.assertEqual(self.cpu.registers.A, 0xFF)
+        self.assertEqual(self.cpu.flags._flags, 0x87)
+        self.assertEqual(self.cpu.cycles, 4)
+
+    def test_cmp(self):
+        for index, register in REGISTERS:
+            opcode = 0xB8 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.run_opcode(opcode, 0x14, 0x22, register, 0x02)  # CMP register
+
+                self.assertEqual(self.cpu.registers.A, 0x14)
+                self.assertEqual(self.cpu.flags._flags, 0x93)
+                self.assertEqual(self.cpu.cycles, 4)
+
+        self.run_opcode(0xBF, 0x14, 0x14, "A", 0x03)  # CMP A
+
+        self.assertEqual(self.cpu.registers.A, 0x14)
+        self.assertEqual(self.cpu.flags._flags, 0x56)
+        self.assertEqual(self.cpu.cycles, 4)
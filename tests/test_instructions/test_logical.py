@@ -0,0 +1,64 @@
+"""
+Test class for the register logical Instructions: ANA, XRA and ORA.
+"""
+
+from tests.base.intel_8080 import Intel8080_Base
+
+REGISTERS = ((0, "B"), (1, "C"), (2, "D"), (3, "E"), (4, "H"), (5, "L"))
+
+
+class Test_Logical_Instructions(Intel8080_Base):
+
+    def run_opcode(self, opcode, a, value, register, flags):
+        self.setUp()
+        self.cpu.write_memory_byte(0x0000, opcode)
+        self.cpu.registers.A = a
+        setattr(self.cpu.registers, register, value)
+        self.cpu.flags._flags = flags
+
+        self.cpu.execute_instruction()
+
+        self.assertEqual(self.cpu.PC, 0x0001)
+        self.assertEqual(self.cpu.cycles, 4)
+
+    def test_ana(self):
+        for index, register in REGISTERS:
+            opcode = 0xA0 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.run_opcode(opcode, 0xFC, 0x0F, register, 0x03)  # ANA register
+
+                self.assertEqual(self.cpu.registers.A, 0x0C)
+                self.assertEqual(self.cpu.flags._flags, 0x16)
+
+        self.run_opcode(0xA7, 0x81, 0x81, "A", 0x03)  # ANA A
+
+        self.assertEqual(self.cpu.registers.A, 0x81)
+        self.assertEqual(self.cpu.flags._flags, 0x86)
+
+    def test_xra(self):
+        for index, register in REGISTERS:
+            opcode = 0xA8 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.run_opcode(opcode, 0x5C, 0x78, register, 0x03)  # XRA register
+
+                self.assertEqual(self.cpu.registers.A, 0x24)
+                self.assertEqual(self.cpu.flags._flags, 0x06)
+
+        self.run_opcode(0xAF, 0x5C, 0x5C, "A", 0x03)  # XRA A
+
+        self.assertEqual(self.cpu.registers.A, 0x00)
+        self.assertEqual(self.cpu.flags._flags, 0x46)
+
+    def test_ora(self):
+        for index, register in REGISTERS:
+            opcode = 0xB0 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.run_opcode(opcode, 0x33, 0x0F, register, 0x13)  # ORA register
+
+                self.assertEqual(self.cpu.registers.A, 0x3F)
+                self.assertEqual(self.cpu.flags._flags, 0x06)
+
+        self.run_opcode(0xB7, 0x80, 0x80, "A", 0x13)  # ORA A
+
+        self.assertEqual(self.cpu.registers.A, 0x80)
+        self.assertEqual(self.cpu.flags._flags, 0x82)
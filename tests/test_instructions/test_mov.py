@@ -0,0 +1,89 @@
+"""
+Test class for MOV and MVI Instructions.
+"""
+
+from tests.base.intel_8080 import Intel8080_Base
+
+REGISTERS = "BCDEHLMA"
+
+VALUES = {"B": 0x11, "C": 0x22, "D": 0x33, "E": 0x44, "H": 0x20, "L": 0x10, "A": 0x77}
+
+
+class Test_MOV_Instruction(Intel8080_Base):
+
+    def set_registers(self):
+        for register, value in VALUES.items():
+            setattr(self.cpu.registers, register, value)
+
+    def test_mov_reg_reg(self):
+        for dst_index, dst in enumerate(REGISTERS):
+            for src_index, src in enumerate(REGISTERS):
+                if "M" in (dst, src):
+                    continue
+                opcode = 0x40 | (dst_index << 0x03) | src_index
+                with self.subTest(opcode=f"0x{opcode:02x}"):
+                    self.setUp()
+                    self.set_registers()
+                    self.cpu.write_memory_byte(0x0000, opcode)  # MOV dst, src
+
+                    self.cpu.execute_instruction()
+
+                    expected = dict(VALUES, **{dst: VALUES[src]})
+                    for register, value in expected.items():
+                        self.assertEqual(getattr(self.cpu.registers, register), value)
+                    self.assertEqual(self.cpu.flags._flags, 0x02)
+                    self.assertEqual(self.cpu.PC, 0x0001)
+                    self.assertEqual(self.cpu.cycles, 5)
+
+    def test_mov_reg_m(self):
+        for index, register in enumerate(REGISTERS):
+            if register == "M":
+                continue
+            opcode = 0x46 | (index << 0x03)
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.set_registers()
+                self.cpu.write_memory_byte(0x0000, opcode)  # MOV register, M
+                self.cpu.write_memory_byte(0x2010, 0x5A)
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(getattr(self.cpu.registers, register), 0x5A)
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 7)
+
+    def test_mov_m_reg(self):
+        for index, register in enumerate(REGISTERS):
+            if register == "M":
+                continue
+            opcode = 0x70 | index
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.set_registers()
+                self.cpu.write_memory_byte(0x0000, opcode)  # MOV M, register
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.cpu.read_memory_byte(0x2010), VALUES[register])
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 7)
+
+    def test_mvi_reg(self):
+        for index, register in enumerate(REGISTERS):
+            if register == "M":
+                continue
+            opcode = 0x06 | (index << 0x03)
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.set_registers()
+                self.cpu.write_memory_byte(0x0000, opcode)  # MVI register, A5h
+                self.cpu.write_memory_byte(0x0001, 0xA5)
+
+                self.cpu.execute_instruction()
+
+                expected = dict(VALUES, **{register: 0xA5})
+                for name, value in expected.items():
+                    self.assertEqual(getattr(self.cpu.registers, name), value)
+                self.assertEqual(self.cpu.flags._flags, 0x02)
+                self.assertEqual(self.cpu.PC, 0x0002)
+                self.assertEqual(self.cpu.cycles, 7)
@@ -0,0 +1,108 @@
+"""
+Test class for the register pair Instructions: LXI, INX, DCX, DAD, STAX and LDAX.
+"""
+
+from tests.base.intel_8080 import Intel8080_Base
+
+
+class Test_Register_Pair_Instructions(Intel8080_Base):
+
+    def set_pair(self, pair, value):
+        setattr(self.cpu.registers, pair[0], value >> 0x08)
+        setattr(self.cpu.registers, pair[1], value & 0xFF)
+
+    def get_pair(self, pair):
+        registers = self.cpu.registers
+        return (getattr(registers, pair[0]) << 0x08) | getattr(registers, pair[1])
+
+    def test_lxi(self):
+        for opcode, pair in ((0x01, "BC"), (0x11, "DE"), (0x21, "HL")):
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x0000, opcode)  # LXI pair, 1234h
+                self.cpu.write_memory_byte(0x0001, 0x34)
+                self.cpu.write_memory_byte(0x0002, 0x12)
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.get_pair(pair), 0x1234)
+                self.assertEqual(self.cpu.PC, 0x0003)
+                self.assertEqual(self.cpu.cycles, 10)
+
+    def test_inx(self):
+        for opcode, pair in ((0x03, "BC"), (0x13, "DE"), (0x23, "HL")):
+            for value, expected in ((0x12FF, 0x1300), (0xFFFF, 0x0000)):
+                with self.subTest(opcode=f"0x{opcode:02x}", value=value):
+                    self.setUp()
+                    self.cpu.write_memory_byte(0x0000, opcode)  # INX pair
+                    self.set_pair(pair, value)
+
+                    self.cpu.execute_instruction()
+
+                    self.assertEqual(self.get_pair(pair), expected)
+                    self.assertEqual(self.cpu.flags._flags, 0x02)
+                    self.assertEqual(self.cpu.PC, 0x0001)
+                    self.assertEqual(self.cpu.cycles, 5)
+
+    def test_dcx(self):
+        for opcode, pair in ((0x0B, "BC"), (0x1B, "DE"), (0x2B, "HL")):
+            for value, expected in ((0x1300, 0x12FF), (0x0000, 0xFFFF)):
+                with self.subTest(opcode=f"0x{opcode:02x}", value=value):
+                    self.setUp()
+                    self.cpu.write_memory_byte(0x0000, opcode)  # DCX pair
+                    self.set_pair(pair, value)
+
+                    self.cpu.execute_instruction()
+
+                    self.assertEqual(self.get_pair(pair), expected)
+                    self.assertEqual(self.cpu.flags._flags, 0x02)
+                    self.assertEqual(self.cpu.PC, 0x0001)
+                    self.assertEqual(self.cpu.cycles, 5)
+
+    def test_dad(self):
+        cases = (
+            (0x09, "BC", 0x1234, 0x4321, 0x5555, 0x02),
+            (0x19, "DE", 0xF000, 0x2000, 0x1000, 0x03),
+            (0x29, "HL", 0x8001, 0x8001, 0x0002, 0x03),
+        )
+        for opcode, pair, hl, value, expected, flags in cases:
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x0000, opcode)  # DAD pair
+                self.set_pair(pair, value)
+                self.set_pair("HL", hl)
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.get_pair("HL"), expected)
+                self.assertEqual(self.cpu.flags._flags, flags)
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 10)
+
+    def test_stax(self):
+        for opcode, pair in ((0x02, "BC"), (0x12, "DE")):
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x0000, opcode)  # STAX pair
+                self.set_pair(pair, 0x2010)
+                self.cpu.registers.A = 0x77
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.cpu.read_memory_byte(0x2010), 0x77)
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 7)
+
+    def test_ldax(self):
+        for opcode, pair in ((0x0A, "BC"), (0x1A, "DE")):
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x0000, opcode)  # LDAX pair
+                self.cpu.write_memory_byte(0x2010, 0x99)
+                self.set_pair(pair, 0x2010)
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.cpu.registers.A, 0x99)
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 7)
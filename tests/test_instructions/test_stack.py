@@ -0,0 +1,74 @@
+"""
+Test class for the stack Instructions: PUSH, POP and RST.
+"""
+
+from tests.base.intel_8080 import Intel8080_Base
+
+PAIRS = (("B", "C"), ("D", "E"), ("H", "L"))
+
+
+class Test_Stack_Instructions(Intel8080_Base):
+
+    def test_push(self):
+        for opcode, (high, low) in zip((0xC5, 0xD5, 0xE5), PAIRS):
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x0000, opcode)  # PUSH pair
+                setattr(self.cpu.registers, high, 0x12)
+                setattr(self.cpu.registers, low, 0x34)
+                self.cpu.SP = 0x2400
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.cpu.SP, 0x23FE)
+                self.assertEqual(self.cpu.read_memory_byte(0x23FE), 0x34)
+                self.assertEqual(self.cpu.read_memory_byte(0x23FF), 0x12)
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 11)
+
+    def test_pop(self):
+        for opcode, (high, low) in zip((0xC1, 0xD1, 0xE1), PAIRS):
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x0000, opcode)  # POP pair
+                self.cpu.write_memory_byte(0x23FE, 0x34)
+                self.cpu.write_memory_byte(0x23FF, 0x12)
+                self.cpu.SP = 0x23FE
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(getattr(self.cpu.registers, high), 0x12)
+                self.assertEqual(getattr(self.cpu.registers, low), 0x34)
+                self.assertEqual(self.cpu.SP, 0x2400)
+                self.assertEqual(self.cpu.PC, 0x0001)
+                self.assertEqual(self.cpu.cycles, 10)
+
+    def test_rst(self):
+        for n in range(1, 8):
+            opcode = 0xC7 | (n << 0x03)
+            with self.subTest(opcode=f"0x{opcode:02x}"):
+                self.setUp()
+                self.cpu.write_memory_byte(0x1000, opcode)  # RST n
+                self.cpu.PC = 0x1000
+                self.cpu.SP = 0x2400
+                self.cpu.interrupts_enabled = True
+
+                self.cpu.execute_instruction()
+
+                self.assertEqual(self.cpu.PC, n * 0x08)
+                self.assertEqual(self.cpu.SP, 0x23FE)
+                self.assertEqual(self.cpu.read_memory_byte(0x23FE), 0x01)
+                self.assertEqual(self.cpu.read_memory_byte(0x23FF), 0x10)
+                self.assertFalse(self.cpu.interrupts_enabled)
+                self.assertEqual(self.cpu.cycles, 11)
+
+    def test_rst_interrupts_disabled(self):
+        self.cpu.write_memory_byte(0x1000, 0xCF)  # RST 1
+        self.cpu.PC = 0x1000
+        self.cpu.SP = 0x2400
+
+        self.cpu.execute_instruction()
+
+        self.assertEqual(self.cpu.PC, 0x1001)
+        self.assertEqual(self.cpu.SP, 0x2400)
+        self.assertEqual(self.cpu.cycles, 0)
@@ -7,6 +7,7 @@ import pygame
 from faker import Faker
 
 from xpire.cpus.intel_8080 import Intel8080
+from xpire.instructions.manager import InstructionManager
 from xpire.machine import Machine
 
 fake = Faker()
@@ -34,14 +35,23 @@ class MockPygameEvent:
         if not events:
             events = []
         self.events = [MockPygameEventType(event) for event in events]
+        self.blocked = []
+        self.allowed = []
 
     def get(self):
         return self.events
 
+    def set_blocked(self, event_types):
+        self.blocked.append(event_types)
+
+    def set_allowed(self, event_types):
+        self.allowed.append(event_types)
+
 
 class TestIntel8080(unittest.TestCase):
 
     @patch("xpire.machine.Screen", MockScreen)
+    @patch("xpire.machine.pygame.event", MockPygameEvent())
     def setUp(self):
         self.cpu = Intel8080()
         self.machine = Machine()
@@ -63,6 +73,65 @@ class TestIntel8080(unittest.TestCase):
         self.cpu.memory[0x0000] = 0x12
         assert self.cpu.fetch_byte() == 0x12, "Shoud fetch correct byte"
 
+    def test_execute_rewritten_instruction(self):
+        """
+        Test executing an instruction written directly to memory after loading.
+        """
+        self.cpu.load_program(bytes([0x3C]))  # INR A
+        self.cpu.memory[0x0000] = 0x04  # INR B
+        self.cpu.execute_instruction()
+        self.assertEqual(self.cpu.registers.A, 0x00)
+        self.assertEqual(self.cpu.registers.B, 0x01)
+        self.assertEqual(self.cpu.PC, 0x0001)
+
+    def test_load_program(self):
+        self.cpu.memory[0x0100] = 0xFF
+        self.cpu.load_program(bytes([0x3C, 0x76]))  # INR A; HLT
+        self.assertEqual(len(self.cpu.memory), 0x10000)
+        self.assertEqual(self.cpu.memory[0x0000:0x0003], bytes([0x3C, 0x76, 0x00]))
+        self.assertEqual(self.cpu.memory[0x0100], 0x00)
+
+    def test_load_program_too_large(self):
+        with self.assertRaises(Exception):
+            self.cpu.load_program(bytes(0x10001))
+        self.assertEqual(len(self.cpu.memory), 0x10000)
+
+    def test_specialize_requires_inline(self):
+        """
+        Test a handler taking registers must be written as an inline template.
+        """
+
+        def handler(cpu, register):
+            pass
+
+        with self.assertRaises(Exception):
+            InstructionManager.specialize(0x00, handler, ("B",))
+        self.assertIs(InstructionManager.specialize(0x00, handler, ()), handler)
+
+    def test_step_many(self):
+        self.cpu.step_many(10)
+        self.assertEqual(self.cpu.cycles, 12)
+        self.assertEqual(self.cpu.PC, 0x0003)
+
+        self.cpu.memory[0x0003] = 0x76
+        self.cpu.step_many(100)
+        self.assertTrue(self.cpu.halted)
+        self.assertEqual(self.cpu.PC, 0x0004)
+
+    def test_execute_written_instruction(self):
+        """
+        Test executing an instruction again after it was overwritten.
+        """
+        self.cpu.PC = 0x2000
+        self.cpu.write_memory_byte(0x2000, 0x3C)  # INR A
+        self.cpu.execute_instruction()
+
+        self.cpu.PC = 0x2000
+        self.cpu.write_memory_byte(0x2000, 0x04)  # INR B
+        self.cpu.execute_instruction()
+        self.assertEqual(self.cpu.registers.A, 0x01)
+        self.assertEqual(self.cpu.registers.B, 0x01)
+
     def test_flags(self):
         self.assertEqual(self.cpu.flags.Z, False)
         self.assertEqual(self.cpu.flags.S, False)
@@ -264,6 +333,10 @@ class TestIntel8080(unittest.TestCase):
         self.assertEqual(self.cpu.memory[0x0000], 0xBE)
         self.assertEqual(self.cpu.memory[0x0001], 0x42)
 
+        self.cpu.write_memory_word(0xFFFF, 0x12, 0x34)
+        self.assertEqual(self.cpu.memory[0xFFFF], 0x34)
+        self.assertEqual(self.cpu.memory[0x0000], 0x12)
+
     def test_push_to_stack(self):
         """
         Test push to stack.
@@ -278,6 +351,17 @@ class TestIntel8080(unittest.TestCase):
         self.assertEqual(self.cpu.memory[self.cpu.SP - 1], 0x00)
         self.assertEqual(self.cpu.SP, 0xFFFE)
 
+    def test_restart(self):
+        self.cpu.PC = 0x1234
+        self.cpu.SP = 0x2400
+        self.cpu.interrupts_enabled = True
+        self.cpu.execute_interrupt(0xFF)
+
+        self.assertEqual(self.cpu.PC, 0x38)
+        self.assertEqual(self.cpu.SP, 0x23FE)
+        self.assertEqual(self.cpu.read_memory_word(self.cpu.SP), 0x1234)
+        self.assertFalse(self.cpu.interrupts_enabled)
+
     def test_add_register_to_accumulator(self):
         self.cpu.registers.A = 0x33
         self.cpu.registers.C = 0x0F
@@ -492,6 +576,36 @@ class TestIntel8080(unittest.TestCase):
 
         self.assertTrue(machine.cpu.halted)
 
+    @patch("xpire.machine.Screen", MockScreen)
+    @patch("xpire.machine.pygame.event", MockPygameEvent())
+    def test_machine_run_interrupt_budget(self):
+        machine = Machine()
+        machine.cpu.memory[0x0000] = 0x76  # HLT
+        machine.cpu.PC = 0x0001
+        machine.cpu.SP = 0x0003
+        machine.cpu.interrupts_enabled = True
+        with patch.object(
+            machine, "render_screen", wraps=machine.render_screen
+        ) as render_screen:
+            machine.run()
+
+        # The interrupt comes after the 8334th NOP, the first to go past the
+        # refresh interval, and the CPU halts after wrapping around memory.
+        self.assertTrue(machine.cpu.halted)
+        self.assertEqual(render_screen.call_count, 1)
+        self.assertEqual(machine.cpu.SP, 0x0001)
+        self.assertEqual(machine.cpu.read_memory_word(0x0001), 0x208F)
+        self.assertFalse(machine.cpu.interrupts_enabled)
+
+    @patch("xpire.machine.Screen", MockScreen)
+    def test_machine_event_filter(self):
+        event = MockPygameEvent()
+        with patch("xpire.machine.pygame.event", event):
+            Machine()
+
+        self.assertEqual(event.blocked, [None])
+        self.assertEqual(event.allowed, [[pygame.QUIT]])
+
     @patch("xpire.machine.Screen", MockScreen)
     @patch("xpire.machine.pygame.event", MockPygameEvent())
     def test_machine_invalid_rom(self):
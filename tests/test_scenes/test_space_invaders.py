@@ -120,13 +120,10 @@ class TestSpaceInvadersScene(ColorBaseTest):
             self.scene.handle_events()
             self.scene.p1_controller.write.assert_called_with(0x40)
 
-    @unittest.mock.patch("xpire.scenes.space_invaders.CYCLES_PER_LINE", 1)
+    @unittest.mock.patch("xpire.scenes.space_invaders.CYCLES_PER_LINE", 123)
     @unittest.mock.patch("xpire.scenes.space_invaders.SCREEN_HEIGHT", 1)
     def test_update(self):
-        def mock_execute_instruction():
-            self.scene.cpu.cycles += 1
-
-        self.scene.cpu.execute_instruction = mock_execute_instruction
+        self.scene.cpu.step_many = unittest.mock.Mock()
         self.scene.handle_events = unittest.mock.Mock()
         self.scene.handle_interrupts = unittest.mock.Mock()
         self.scene.draw_line = unittest.mock.Mock()
@@ -135,6 +132,7 @@ class TestSpaceInvadersScene(ColorBaseTest):
         self.scene.handle_events.assert_called_once()
         self.scene.handle_interrupts.assert_called_once()
         self.scene.draw_line.assert_called_once()
+        self.scene.cpu.step_many.assert_called_once_with(123)  # CYCLES_PER_LINE
 
     def test_handle_interrupts(self):
         self.scene.cpu.execute_interrupt = unittest.mock.Mock()
@@ -151,9 +149,25 @@ class TestSpaceInvadersScene(ColorBaseTest):
 
         self.scene.cpu.memory[0x2400:0x2420] = [0xFF] * 0x20
         self.scene.draw_line(0)
-        for i in range(self.scene.surface.get_width()):
-            self.assertEqual(self.scene.surface.get_at((i, 0)), Colors.RED)
-            self.assertNotEqual(self.scene.surface.get_at((i, 1)), Colors.RED)
+        for i in range(self.scene.surface.get_height()):
+            self.assertEqual(self.scene.surface.get_at((0, i)), Colors.RED)
+            self.assertNotEqual(self.scene.surface.get_at((1, i)), Colors.RED)
+
+    def test_draw_line_unchanged(self):
+        self.scene.cpu.memory[0x2400:0x2420] = [0xFF] * 0x20
+        self.scene.draw_line(0)
+        self.scene.surface.fill(Colors.RED)
+
+        self.scene.draw_line(0)
+        self.assertEqual(self.scene.surface.get_at((0, 0)), Colors.RED)
+
+        self.scene.cpu.memory[0x2400] = 0x00
+        self.scene.draw_line(0)
+        self.assertEqual(self.scene.surface.get_at((0, 0)), Colors.WHITE)
+        self.assertEqual(
+            self.scene.surface.get_at((0, self.scene.surface.get_height() - 1)),
+            Colors.BLACK,
+        )
 
     def test_get_ink_color(self):
         color = self.scene.get_ink_color()
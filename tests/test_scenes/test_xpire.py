@@ -14,9 +14,9 @@ class TestXpireScene(ColorBaseTest):
         self.scene.get_background_color.return_value = Colors.RED
 
         self.scene.draw_line(0)
-        for i in range(self.scene.surface.get_width()):
-            self.assertEqual(self.scene.surface.get_at((i, 0)), Colors.RED)
-            self.assertNotEqual(self.scene.surface.get_at((i, 1)), Colors.RED)
+        for i in range(self.scene.surface.get_height()):
+            self.assertEqual(self.scene.surface.get_at((0, i)), Colors.RED)
+            self.assertNotEqual(self.scene.surface.get_at((1, i)), Colors.RED)
 
         self.scene.get_background_color.assert_called_once()
 
@@ -31,7 +31,6 @@ class TestScreen(unittest.TestCase):
             self.cpu.memory[i] = 0xFF if i % 2 == 0 else 0x00
 
         screen = Screen(width=224, height=256, title="Xpire", scale=3)
-        screen.color_table = [WHITE_COLOR]
         screen.render(self.cpu)
 
         assert screen._screen.get_size() == (224, 256)
@@ -43,3 +42,30 @@ class TestScreen(unittest.TestCase):
                 if byte_index % 2 == 1:
                     assert screen._screen.get_at((x, y)) == WHITE_COLOR
                 counter += 1
+
+    def test_font_loaded_once(self):
+        """
+        Test the debug font is loaded on the first render and then reused.
+        """
+        screen = Screen(width=224, height=256, title="Xpire", scale=3)
+        self.assertIsNone(screen.font)
+
+        screen.render(self.cpu)
+        font = screen.font
+        self.assertIsNotNone(font)
+
+        screen.render(self.cpu)
+        self.assertIs(screen.font, font)
+
+    def test_render_text_cached(self):
+        """
+        Test a debug line is only rendered again when its text changes.
+        """
+        screen = Screen(width=224, height=256, title="Xpire", scale=3)
+        screen.render(self.cpu)
+
+        surface = screen.render_text(1, "FPS: 60")
+        self.assertIs(screen.render_text(1, "FPS: 60"), surface)
+        self.assertIsNot(screen.render_text(2, "FPS: 60"), surface)
+        self.assertIsNot(screen.render_text(1, "FPS: 59"), surface)
+        self.assertEqual(len(screen.text_lines), 2)
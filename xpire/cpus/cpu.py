@@ -8,13 +8,11 @@ instructions.
 
 import xpire.instructions.common as OPCodes
 from xpire.cpus.abstract import AbstractCPU
-from xpire.decorators import increment_program_counter
 from xpire.devices.bus import Bus
 from xpire.exceptions import SystemHalt
 from xpire.flags import FlagsManager
 from xpire.instructions.manager import InstructionManager as manager
 from xpire.registers.intel_8080 import Registers
-from xpire.utils import join_bytes
 
 
 class CPU(AbstractCPU):
@@ -61,29 +59,76 @@ class CPU(AbstractCPU):
         self.flags = FlagsManager()
         self.bus = Bus()
 
+    def load_program(self, rom: bytes) -> None:
+        """
+        Load a ROM image at address 0x0000.
+
+        The image is copied into a new, zero-filled 64 KiB memory. This is
+        the shared ROM load path of the Machine and the scenes.
+
+        Args:
+            rom (bytes): The ROM image, at most 64 KiB.
+
+        Raises:
+            Exception: If the ROM image is larger than 64 KiB.
+        """
+        if len(rom) > 0x10000:
+            raise Exception("ROM is too large, max size is 64kb")
+
+        memory = bytearray(0x10000)
+        memory[: len(rom)] = rom
+        self.memory = memory
+
     def execute_instruction(self) -> None:
         """
         Execute a single instruction.
 
-        This method fetches and executes the next instruction. If an exception
-        occurs during execution, it checks if the exception is a SystemHalt.
-        If its not, it raises the exception.
+        This method fetches the next opcode and calls its dispatch table
+        entry. If an exception occurs during execution, it checks if the
+        exception is a SystemHalt. If its not, it raises the exception.
 
         Returns:
             None
         """
         try:
-            opcode = self.fetch_byte()
-            manager.execute(opcode, self)
+            pc = self.PC
+            self.PC = pc + 0x01
+            manager.table[self.memory[pc & 0xFFFF]](self)
+        except SystemHalt:
+            self.halted = True
+            return
+
+    def step_many(self, cycles: int) -> None:
+        """
+        Execute instructions until the cycle counter reaches cycles.
+
+        This is the batched form of calling execute_instruction while
+        `self.cycles < cycles`, meant for host loops that run the CPU for a
+        budget of cycles between interrupt checks. The memory and the
+        dispatch table stay in locals for the whole budget.
+        Execution stops early if the CPU halts.
+
+        Args:
+            cycles (int): The cycle count to run up to.
+
+        Returns:
+            None
+        """
+        memory = self.memory
+        table = manager.table
+        try:
+            while self.cycles < cycles:
+                pc = self.PC
+                self.PC = pc + 0x01
+                table[memory[pc & 0xFFFF]](self)
         except SystemHalt:
             self.halted = True
             return
 
     def execute_interrupt(self, opcode: int) -> None:
-        manager.execute(opcode, self)
+        manager.table[opcode](self)
         self.interrupts_enabled = False
 
-    @increment_program_counter()
     def fetch_byte(self) -> int:
         """
         Fetch a byte from memory at the current program counter (PC) and
@@ -92,7 +137,9 @@ class CPU(AbstractCPU):
         Returns:
             int: The value of the fetched byte.
         """
-        return self.read_memory_byte(self.PC)
+        pc = self.PC
+        self.PC = pc + 0x01
+        return self.memory[pc & 0xFFFF]
 
     def fetch_word(self) -> int:
         """
@@ -106,9 +153,10 @@ class CPU(AbstractCPU):
         Returns:
             int: The value of the fetched word.
         """
-        addr_l = self.fetch_byte()
-        addr_h = self.fetch_byte()
-        return join_bytes(addr_h, addr_l)
+        pc = self.PC
+        self.PC = pc + 0x02
+        memory = self.memory
+        return (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
 
     def read_memory_byte(self, addr: int) -> int:
         """
@@ -138,9 +186,8 @@ class CPU(AbstractCPU):
         Returns:
             tuple[int, int]: The fetched word as a tuple of two values.
         """
-        l_addr = self.read_memory_byte(addr)
-        h_addr = self.read_memory_byte(addr + 0x01)
-        return h_addr, l_addr
+        memory = self.memory
+        return memory[(addr + 0x01) & 0xFFFF], memory[addr & 0xFFFF]
 
     def read_memory_word(self, addr: int) -> int:
         """
@@ -157,21 +204,8 @@ class CPU(AbstractCPU):
         Returns:
             int: The word value stored at the specified memory address.
         """
-        h_addr, l_addr = self.read_memory_word_bytes(addr)
-        return join_bytes(h_addr, l_addr)
-
-    def decrement_stack_pointer(self) -> None:
-        """
-        Decrement the stack pointer (SP) by one, wrapping around if necessary.
-
-        This method adjusts the stack pointer by incrementing it by one and
-        ensures it does not exceed the maximum addressable memory. The resulting
-        value is wrapped using a bitwise AND with the maximum memory address,
-        effectively decrementing the stack pointer with wrapping behavior.
-        """
-        new_value = self.SP - 0x02
-        self.SP = new_value & 0xFFFF
-        return None
+        memory = self.memory
+        return (memory[(addr + 0x01) & 0xFFFF] << 0x08) | memory[addr & 0xFFFF]
 
     @manager.add_instruction(OPCodes.NOP)
     def exec_no_operation(self) -> None:
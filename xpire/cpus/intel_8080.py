@@ -3,9 +3,8 @@ Intel 8080 CPU implementation.
 """
 
 from xpire.cpus.cpu import CPU
-from xpire.decorators import increment_stack_pointer
 from xpire.instructions.manager import InstructionManager as manager
-from xpire.utils import get_ls_nib, get_twos_complement, join_bytes, split_word
+from xpire.utils import SUB_AUX_CARRY, ZSP
 
 
 class Intel8080(CPU):
@@ -21,8 +20,6 @@ class Intel8080(CPU):
         initializes the registers to zero.
         """
         super().__init__(*args, **kwargs)
-        self.out = {}
-
         self.interrupts_enabled = False
 
     def write_memory_byte(self, address, value) -> None:
@@ -34,32 +31,47 @@ class Intel8080(CPU):
         address = address & 0xFFFF
         self.memory[address] = value & 0xFF
 
+    def _write_byte(self, address: int, value: int) -> None:
+        """
+        Store a byte in memory without masking the address or the value.
+
+        For handlers whose address comes from a register pair or an immediate
+        word and whose value is already a byte.
+        """
+        self.memory[address] = value
+
     def _push(self, high_byte, low_byte) -> None:
         """
         Push a word to the stack.
 
         This method decrements the stack pointer by two and stores
         the given high and low bytes at the new stack pointer location.
-        The high byte is stored first, followed by the low byte.
+        The low byte goes to the lower address, followed by the high byte.
 
         Args:
             high_byte (int): The high byte of the word to push.
             low_byte (int): The low byte of the word to push.
         """
-        self.decrement_stack_pointer()
-        self.write_memory_word(self.SP, high_byte, low_byte)
+        sp = (self.SP - 0x02) & 0xFFFF
+        self.SP = sp
+        memory = self.memory
+        memory[sp] = low_byte & 0xFF
+        sp = (sp + 0x01) & 0xFFFF
+        memory[sp] = high_byte & 0xFF
 
     def write_memory_word(self, address, high_byte, low_byte) -> None:
         """
         Store a 16-bit value in memory at the specified address.
 
         This method takes a 16-bit address and a 16-bit value, and stores the value in memory at the specified address.
-        The value is stored in memory as a 16-bit value (i.e. high byte first, low byte second).
+        The value is stored in little endian order (i.e. low byte at the address, high byte at the next one).
         """
-        self.write_memory_byte(address, low_byte)
-        self.write_memory_byte(address + 0x01, high_byte)
+        memory = self.memory
+        address &= 0xFFFF
+        memory[address] = low_byte & 0xFF
+        address = (address + 0x01) & 0xFFFF
+        memory[address] = high_byte & 0xFF
 
-    @increment_stack_pointer()
     def _pop(self) -> tuple[int, int]:
         """
         Pop a 16-bit value from the stack.
@@ -67,89 +79,132 @@ class Intel8080(CPU):
         This instruction pops two bytes from the stack and returns them as a 16-bit value (i.e. high byte first, low byte second).
         The stack pointer is incremented by two after the pop.
         """
-        return self.read_memory_word_bytes(self.SP)
-
-    def set_flags(self, value: int, mask: int = 0xFF) -> None:
-        self.flags.Z = value == 0x00
-        self.flags.S = bool(value & 0x80)
-        self.flags.P = self.check_parity(value, mask)
+        sp = self.SP
+        memory = self.memory
+        self.SP = (sp + 0x02) & 0xFFFF
+        return memory[(sp + 0x01) & 0xFFFF], memory[sp & 0xFFFF]
 
-    def check_parity(self, value: int, mask: int = 0xFF) -> bool:
-        return (bin(value & mask).count("1") % 2) == 0
-
-    def set_carry_flag(self, value: int, mask: int = 0xFF) -> None:
-        self.flags.C = value > mask or value < 0x00
+    def decrement_byte_value(self, value: int) -> int:
+        flags = self.flags
+        result = value - 0x01
 
-    def set_aux_carry_flag(self, a: int, b: int, mask: int = 0x0F) -> None:
-        result = (a & mask) + (b & mask)
-        if result > mask or result < 0x00:
-            self.flags.A = True
-        else:
-            self.flags.A = False
+        masked = result & 0xFF
+        flags._flags = (
+            (flags._flags & 0x2B)
+            | (0x10 if (value & 0x0F) == 0x00 else 0x00)
+            | ZSP[masked]
+        )
 
-    def substract_with_twos_complement(self, v1: int, v2: int) -> int:
-        compl = get_twos_complement(v2)
-        result = v1 + compl
+        return result
 
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.A = (get_ls_nib(v1) + get_ls_nib(compl)) > 0x0F
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
+    def compare_with_twos_complement(self, v1: int, v2: int) -> int:
+        flags = self.flags
+        result = v1 - v2
+
+        value = result & 0xFF
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | SUB_AUX_CARRY[((v1 & 0x0F) << 0x04) | (v2 & 0x0F)]
+            | ZSP[value]
+            | ((result >> 0x08) & 0x01)
+        )
 
-        return result
+    def _cond_ret(self, condition: int) -> None:
+        """
+        Return from a subroutine if the given condition is met.
 
-    def decrement_byte_value(self, value: int) -> int:
-        result = value - 0x01
+        Shared body for every conditional RET opcode. When the condition
+        holds, the return address is popped from the stack into the PC
+        (11 cycles), otherwise execution falls through (5 cycles).
 
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.A = get_ls_nib(value) == 0x00
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
+        Args:
+            condition (int): The already evaluated flag condition, met when non-zero.
+        """
+        if condition:
+            sp = self.SP
+            memory = self.memory
+            self.SP = (sp + 0x02) & 0xFFFF
+            self.PC = (memory[(sp + 0x01) & 0xFFFF] << 0x08) | memory[sp]
+            self.cycles += 11
+            return
+        self.cycles += 5
 
-        return result
+    def _cond_call(self, condition: int) -> None:
+        """
+        Call the subroutine at the immediate address if the given condition is met.
 
-    def compare_with_twos_complement(self, v1: int, v2: int) -> int:
-        compl = get_twos_complement(v2)
-        result = v1 + compl
+        Shared body for every conditional CALL opcode. When the condition
+        holds, the return address is pushed to the stack and the PC jumps to
+        the 16-bit immediate address (17 cycles), otherwise the PC only skips
+        the address and execution falls through (11 cycles).
 
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.S = (result & 0x80) != 0
-        self.flags.A = (get_ls_nib(v1) + get_ls_nib(compl)) > 0x0F
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.C = result <= 0xFF
+        Args:
+            condition (int): The already evaluated flag condition, met when non-zero.
+        """
+        pc = self.PC
+        if condition:
+            memory = self.memory
+            address = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+            pc += 0x02
+            sp = (self.SP - 0x02) & 0xFFFF
+            self.SP = sp
+            memory[sp] = pc & 0xFF
+            sp = (sp + 0x01) & 0xFFFF
+            memory[sp] = (pc >> 0x08) & 0xFF
+            self.PC = address
+            self.cycles += 17
+            return
+        self.PC = pc + 0x02
+        self.cycles += 11
 
     @manager.add_instruction(0x01, ["B", "C"])
     @manager.add_instruction(0x11, ["D", "E"])
     @manager.add_instruction(0x21, ["H", "L"])
+    @manager.inline(
+        "pc = cpu.PC",
+        "cpu.PC = pc + 0x02",
+        "memory = cpu.memory",
+        "registers = cpu.registers",
+        "registers.{1} = memory[pc & 0xFFFF]",
+        "registers.{0} = memory[(pc + 0x01) & 0xFFFF]",
+        "cpu.cycles += 10",
+    )
     def lxi_reg_d16(self, h: int, l: int) -> None:
-        self.registers[l] = self.fetch_byte()
-        self.registers[h] = self.fetch_byte()
-        self.cycles += 10
+        """
+        Load the two bytes of immediate data into the specified register pair.
+
+        The first byte goes to the low-order register, the second to the high-order one.
+        """
 
     @manager.add_instruction(0x02, ["BC"])
     @manager.add_instruction(0x12, ["DE"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "address = (registers.{0[0]} << 0x08) | registers.{0[1]}",
+        "cpu.memory[address] = registers.A",
+        "cpu.cycles += 7",
+    )
     def stax_reg(self, register: str) -> None:
-        address = self.registers[register]
-        self.write_memory_byte(address, self.registers.A)
-        self.cycles += 7
+        """
+        Store the accumulator at the address held in the specified register pair.
+        """
 
     @manager.add_instruction(0x03, ["B", "C"])
     @manager.add_instruction(0x13, ["D", "E"])
     @manager.add_instruction(0x23, ["H", "L"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "value = (((registers.{0} << 0x08) | registers.{1}) + 0x01) & 0xFFFF",
+        "registers.{0} = value >> 0x08",
+        "registers.{1} = value & 0xFF",
+        "cpu.cycles += 5",
+    )
     def inx_reg(self, h: int, l: int) -> None:
         """
         Increment the value of the specified register pair by one.
 
         Condition bits affected: Zero, Sign, Parity, Auxiliary.
         """
-        value = join_bytes(self.registers[h], self.registers[l])
-        result = value + 0x01
-        new_value = result & 0xFFFF
-
-        high, low = split_word(new_value)
-        self.registers[h] = high
-        self.registers[l] = low
-        self.cycles += 5
 
     @manager.add_instruction(0x04, ["B"])
     @manager.add_instruction(0x0C, ["C"])
@@ -158,21 +213,25 @@ class Intel8080(CPU):
     @manager.add_instruction(0x24, ["H"])
     @manager.add_instruction(0x2C, ["L"])
     @manager.add_instruction(0x3C, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "value = registers.{0}",
+        "new_value = (value + 0x01) & 0xFF",
+        "registers.{0} = new_value",
+        "flags = cpu.flags",
+        "flags._flags = (",
+        "    (flags._flags & 0x2B)",
+        "    | (0x10 if (value & 0x0F) == 0x0F else 0x00)",
+        "    | ZSP[new_value]",
+        ")",
+        "cpu.cycles += 5",
+    )
     def inr_reg(self, register: int) -> None:
         """
         Increment the value of the specified register by one.
 
         Condition bits affected: Zero, Sign, Parity, Auxiliary.
         """
-        value = self.registers[register]
-        result = value + 0x01
-        new_value = result & 0xFF
-        self.registers[register] = new_value
-
-        self.set_flags(new_value)
-        self.set_aux_carry_flag(value, 0x01)
-
-        self.cycles += 5
 
     @manager.add_instruction(0x05, ["B"])
     @manager.add_instruction(0x0D, ["C"])
@@ -181,20 +240,20 @@ class Intel8080(CPU):
     @manager.add_instruction(0x25, ["H"])
     @manager.add_instruction(0x2D, ["L"])
     @manager.add_instruction(0x3D, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "new_value = (registers.{0} - 0x01) & 0xFF",
+        "registers.{0} = new_value",
+        "flags = cpu.flags",
+        "flags._flags = (flags._flags & 0x2B) | ZSP[new_value]",
+        "cpu.cycles += 5",
+    )
     def dcr_reg(self, register: int) -> None:
         """
         Decrement the value of the specified register by one.
 
         Condition bits affected: Zero, Sign, Parity, Auxiliary Carry
         """
-        reg_value = self.registers[register]
-        result = reg_value - 0x01
-        new_value = result & 0xFF
-        self.registers[register] = new_value
-
-        self.set_flags(new_value)
-        self.flags.A = ((result & 0xF) - 1) > 0xF
-        self.cycles += 5
 
     @manager.add_instruction(0x06, ["B"])
     @manager.add_instruction(0x0E, ["C"])
@@ -203,6 +262,12 @@ class Intel8080(CPU):
     @manager.add_instruction(0x26, ["H"])
     @manager.add_instruction(0x2E, ["L"])
     @manager.add_instruction(0x3E, ["A"])
+    @manager.inline(
+        "pc = cpu.PC",
+        "cpu.PC = pc + 0x01",
+        "cpu.registers.{0} = cpu.memory[pc & 0xFFFF]",
+        "cpu.cycles += 7",
+    )
     def mvi_reg(self, register: int) -> callable:
         """
         Move an immediate value to the specified register.
@@ -215,8 +280,6 @@ class Intel8080(CPU):
             register (int): The register identifier where the immediate value
                             should be stored.
         """
-        self.registers[register] = self.fetch_byte()
-        self.cycles += 7
 
     @manager.add_instruction(0x07)
     def rlc(self) -> None:
@@ -229,16 +292,13 @@ class Intel8080(CPU):
 
         Condition bits affected: Carry.
         """
-        accumulator = self.registers.A & 0xFF
-        # Obtener el bit menos significativo (LSB) del acumulador
-        new_carry = accumulator & 0x80
-        # Rotar el acumulador a la izquierda
-        # El bit de carry se convierte en el bit menos significativo (LSB)
-        accumulator = (accumulator << 1) | (new_carry >> 7)
-        # Asegurarse de que el acumulador siga siendo de 8 bits
-        accumulator = accumulator & 0xFF
-        self.registers.A = accumulator
-        self.flags.C = True if new_carry else False
+        registers = self.registers
+        flags = self.flags
+        accumulator = registers.A
+        # El bit más significativo (MSB) pasa al carry y al bit menos significativo
+        new_carry = accumulator >> 7
+        registers.A = ((accumulator << 1) & 0xFF) | new_carry
+        flags._flags = (flags._flags & 0xFE) | new_carry
         self.cycles += 4
 
     @manager.add_instruction(0x08)
@@ -249,6 +309,15 @@ class Intel8080(CPU):
     @manager.add_instruction(0x09, ["BC"])
     @manager.add_instruction(0x19, ["DE"])
     @manager.add_instruction(0x29, ["HL"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "result = registers.{0} + ((registers.H << 0x08) | registers.L)",
+        "registers.H = (result >> 0x08) & 0xFF",
+        "registers.L = result & 0xFF",
+        "flags = cpu.flags",
+        "flags._flags = (flags._flags & 0xFE) | (result >> 0x10)",
+        "cpu.cycles += 10",
+    )
     def dad_reg16(self, register: str) -> None:
         """
         The 16-bit number in the specified register pair is added
@@ -258,31 +327,33 @@ class Intel8080(CPU):
 
         Condition bits affected: Carry.
         """
-        value = self.registers[register]
-        result = value + self.registers.HL
-        new_value = result & 0xFFFF
-
-        self.registers.HL = new_value
-        self.set_carry_flag(result, mask=0xFFFF)
-        self.cycles += 10
 
     @manager.add_instruction(0x0A, ["BC"])
     @manager.add_instruction(0x1A, ["DE"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "registers.A = cpu.memory[(registers.{0[0]} << 0x08) | registers.{0[1]}]",
+        "cpu.cycles += 7",
+    )
     def ldax_reg16(self, register: str) -> None:
-        address = self.registers[register]
-        self.registers.A = self.read_memory_byte(address)
-        self.cycles += 7
+        """
+        Load the accumulator from the address held in the specified register pair.
+        """
 
     @manager.add_instruction(0x0B, ["BC"])
     @manager.add_instruction(0x1B, ["DE"])
     @manager.add_instruction(0x2B, ["HL"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "registers.{0} = (registers.{0} - 0x01) & 0xFFFF",
+        "cpu.cycles += 5",
+    )
     def dcx_reg16(self, register: str):
-        value = self.registers[register]
-        result = value - 0x01
-        result = result & 0xFFFF
-        self.registers[register] = result
+        """
+        Decrement the value of the specified register pair by one.
 
-        self.cycles += 5
+        Condition bits affected: None.
+        """
 
     @manager.add_instruction(0x0F)
     def rrc(self) -> None:
@@ -295,33 +366,25 @@ class Intel8080(CPU):
 
         Condition bits affected: Carry.
         """
-        accumulator = self.registers.A & 0xFF
-        # Obtener el bit menos significativo (LSB) del acumulador
+        registers = self.registers
+        flags = self.flags
+        accumulator = registers.A
+        # El bit menos significativo (LSB) pasa al carry y al bit más significativo
         new_carry = accumulator & 0x01
-        # Rotar el acumulador a la derecha
-        # El bit de carry se convierte en el bit más significativo (MSB)
-        accumulator = (accumulator >> 1) | (new_carry << 7)
-        # Asegurarse de que el acumulador siga siendo de 8 bits
-        accumulator = accumulator & 0xFF
-        self.registers.A = accumulator
-        self.flags.C = True if new_carry else False
+        registers.A = (accumulator >> 1) | (new_carry << 7)
+        flags._flags = (flags._flags & 0xFE) | new_carry
         self.cycles += 4
 
     @manager.add_instruction(0x17)
     def ral(self):
-        carry = 1 if self.flags.C else 0
-        a_value = self.registers.A
-        new_carry = a_value & 0x80
+        registers = self.registers
+        flags = self.flags
+        packed = flags._flags
+        a_value = registers.A
 
-        # Rotar el acumulador a la izquierda
         # El bit de carry se convierte en el bit menos significativo (LSB)
-        a_value = (a_value << 1) | carry
-
-        # Asegurarse de que el acumulador siga siendo de 8 bits
-        a_value = a_value & 0xFF
-
-        self.registers.A = a_value
-        self.flags.C = True if new_carry else False
+        registers.A = ((a_value << 1) & 0xFF) | (packed & 0x01)
+        flags._flags = (packed & 0xFE) | (a_value >> 7)
         self.cycles += 4
 
     @manager.add_instruction(0x1F)
@@ -334,57 +397,53 @@ class Intel8080(CPU):
 
         Condition bits affected: Carry.
         """
-        carry = 1 if self.flags.C else 0
-        accumulator = self.registers.A & 0xFF
-        # Obtener el bit menos significativo (LSB) del acumulador
-        new_carry = accumulator & 0x01
-        # Rotar el acumulador a la derecha
+        registers = self.registers
+        flags = self.flags
+        packed = flags._flags
+        accumulator = registers.A
+
         # El bit de carry se convierte en el bit más significativo (MSB)
-        accumulator = (accumulator >> 1) | (carry << 7)
-        # Asegurarse de que el acumulador siga siendo de 8 bits
-        accumulator = accumulator & 0xFF
-        self.registers.A = accumulator
-        self.flags.C = True if new_carry else False
+        registers.A = (accumulator >> 1) | ((packed & 0x01) << 7)
+        flags._flags = (packed & 0xFE) | (accumulator & 0x01)
         self.cycles += 4
 
     @manager.add_instruction(0x22)
     def shld(self) -> None:
-        address = self.fetch_word()
-        self.write_memory_byte(address, self.registers.L)
-        self.write_memory_byte(address + 0x01, self.registers.H)
+        registers = self.registers
+        self.write_memory_word(self.fetch_word(), registers.H, registers.L)
         self.cycles += 16
 
     @manager.add_instruction(0x27)
     def daa(self):
-        accumulator = self.registers.A
-        carry = 1 if self.flags.C else 0
-        half_carry = 1 if self.flags.A else 0
+        registers = self.registers
+        flags = self.flags
+        accumulator = registers.A
+        carry = flags._flags & 0x01
+        half_carry = (flags._flags >> 0x04) & 0x01
 
-        lsb = self.registers.A & 0x0F
+        lsb = registers.A & 0x0F
         if half_carry or lsb > 9:
             accumulator = (accumulator + 0x06) & 0xFF
-            self.flags.A = (lsb + 0x06) > 0xF
+            flags.A = (lsb + 0x06) > 0xF
 
-        msb = self.registers.A >> 4
+        msb = registers.A >> 4
         if carry or msb > 9:
             accumulator = (accumulator + 0x60) & 0xFF
-            self.flags.C = (msb + 0x06) > 0x0F
+            flags.C = (msb + 0x06) > 0x0F
         else:
-            self.flags.C = False
+            flags.C = False
 
-        self.registers.A = accumulator & 0xFF
-        self.flags.Z = (accumulator & 0xFF) == 0x00
-        self.flags.S = (accumulator & 0x80) != 0x00
-        self.flags.P = (bin(accumulator & 0xFF).count("1") % 2) == 0
+        registers.A = accumulator & 0xFF
+        flags._flags = (flags._flags & 0x3B) | ZSP[accumulator & 0xFF]
         self.cycles += 4
 
     @manager.add_instruction(0x2A)
     def lhld(self) -> None:
         address1 = self.fetch_word()
 
-        l = self.read_memory_byte(address1)
-        h = self.read_memory_byte((address1 + 0x01) & 0xFFFF)
-        self.registers.HL = join_bytes(h, l)
+        registers = self.registers
+        registers.L = self.memory[address1]
+        registers.H = self.memory[(address1 + 0x01) & 0xFFFF]
         self.cycles += 16
 
     @manager.add_instruction(0x2F)
@@ -412,7 +471,7 @@ class Intel8080(CPU):
         as a byte at that address.
         """
         address = self.fetch_word()
-        self.write_memory_byte(address, self.registers.A)
+        self._write_byte(address, self.registers.A)
         self.cycles += 13
 
     @manager.add_instruction(0x33)
@@ -422,41 +481,46 @@ class Intel8080(CPU):
 
     @manager.add_instruction(0x34)
     def inr_m(self):
-        m_value = self.read_memory_byte(self.registers.HL)
+        registers = self.registers
+        flags = self.flags
+        m_value = self.memory[registers.HL]
         result = m_value + 0x01
-        self.write_memory_byte(self.registers.HL, result)
+        self._write_byte(registers.HL, result & 0xFF)
 
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.A = (get_ls_nib(m_value) + 0x01) > 0x0F
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
+        flags._flags = (
+            (flags._flags & 0x2B)
+            | (0x10 if ((m_value & 0x0F) + 0x01) > 0x0F else 0x00)
+            | ZSP[result & 0xFF]
+        )
         self.cycles += 10
 
     @manager.add_instruction(0x35)
     def dcr_m(self) -> None:
         address = self.registers.HL
-        result = self.decrement_byte_value(self.read_memory_byte(address))
-        self.write_memory_byte(address, result)
+        result = self.decrement_byte_value(self.memory[address])
+        self._write_byte(address, result & 0xFF)
 
         self.cycles += 10
 
     @manager.add_instruction(0x36)
     def mvi_m_d8(self) -> None:
-        self.write_memory_byte(self.registers.HL, self.fetch_byte())
+        self._write_byte(self.registers.HL, self.fetch_byte())
         self.cycles += 10
 
     @manager.add_instruction(0x37)
     def stc(self):
-        self.flags.C = True
+        self.flags._flags |= 0x01
         self.cycles += 4
 
     @manager.add_instruction(0x39)
     def dad_sp(self) -> None:
-        result = self.SP + self.registers.HL
-        new_value = result & 0xFFFF
-        self.registers.HL = new_value
+        registers = self.registers
+        result = self.SP + ((registers.H << 0x08) | registers.L)
+        registers.H = (result >> 0x08) & 0xFF
+        registers.L = result & 0xFF
 
-        self.set_carry_flag(result, mask=0xFFFF)
+        flags = self.flags
+        flags._flags = (flags._flags & 0xFE) | (result >> 0x10)
         self.cycles += 10
 
     @manager.add_instruction(0x3A)
@@ -468,7 +532,7 @@ class Intel8080(CPU):
         to the accumulator. The value is loaded as a byte, not a word.
         """
         address = self.fetch_word()
-        value = self.read_memory_byte(address)
+        value = self.memory[address]
         self.registers.A = value
         self.cycles += 13
 
@@ -479,7 +543,7 @@ class Intel8080(CPU):
 
     @manager.add_instruction(0x3F)
     def cmc(self):
-        self.flags.C = not self.flags.C
+        self.flags._flags ^= 0x01
         self.cycles += 4
 
     @manager.add_instruction(0x40, ["B", "B"])
@@ -531,9 +595,15 @@ class Intel8080(CPU):
     @manager.add_instruction(0x7C, ["H", "A"])
     @manager.add_instruction(0x7D, ["L", "A"])
     @manager.add_instruction(0x7F, ["A", "A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "registers.{1} = registers.{0}",
+        "cpu.cycles += 5",
+    )
     def mov_reg_reg(self, src: int, dst: int) -> None:
-        self.registers[dst] = self.registers[src]
-        self.cycles += 5
+        """
+        Move the contents of one register to another register.
+        """
 
     @manager.add_instruction(0x46, ["B"])
     @manager.add_instruction(0x4E, ["C"])
@@ -542,9 +612,15 @@ class Intel8080(CPU):
     @manager.add_instruction(0x66, ["H"])
     @manager.add_instruction(0x6E, ["L"])
     @manager.add_instruction(0x7E, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "registers.{0} = cpu.memory[registers.HL]",
+        "cpu.cycles += 7",
+    )
     def mov_reg_m(self, register: int) -> None:
-        self.registers[register] = self.read_memory_byte(self.registers.HL)
-        self.cycles += 7
+        """
+        Move the byte at the address held in H and L to the specified register.
+        """
 
     @manager.add_instruction(0x70, ["B"])
     @manager.add_instruction(0x71, ["C"])
@@ -553,9 +629,16 @@ class Intel8080(CPU):
     @manager.add_instruction(0x74, ["H"])
     @manager.add_instruction(0x75, ["L"])
     @manager.add_instruction(0x77, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "address = registers.HL",
+        "cpu.memory[address] = registers.{0}",
+        "cpu.cycles += 7",
+    )
     def mov_m_reg(self, register: int) -> None:
-        self.write_memory_byte(self.registers.HL, self.registers[register])
-        self.cycles += 7
+        """
+        Move the contents of the specified register to the address held in H and L.
+        """
 
     @manager.add_instruction(0x80, ["B"])
     @manager.add_instruction(0x81, ["C"])
@@ -564,31 +647,44 @@ class Intel8080(CPU):
     @manager.add_instruction(0x84, ["H"])
     @manager.add_instruction(0x85, ["L"])
     @manager.add_instruction(0x87, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "value = registers.{0}",
+        "result = registers.A + value",
+        "flags._flags = (",
+        "    (flags._flags & 0x2A)",
+        "    | (((registers.A & 0x0F) + (value & 0x0F)) & 0x10)",
+        "    | ZSP[result & 0xFF]",
+        "    | (result >> 0x08)",
+        ")",
+        "registers.A = result & 0xFF",
+        "cpu.cycles += 4",
+    )
     def add_reg(self, register: str) -> None:
-        value = self.registers[register]
-        result = self.registers.A + value
-
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.A = (get_ls_nib(self.registers.A) + get_ls_nib(value)) > 0x0F
-        self.flags.C = result > 0xFF
+        """
+        Add the contents of the specified register to the accumulator.
 
-        self.registers.A = result & 0xFF
-        self.cycles += 4
+        Condition bits affected: Carry, Sign, Zero, Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0x86)
     def add_m(self) -> None:
-        value1 = self.registers.A
-        value2 = self.read_memory_byte(self.registers.HL)
+        registers = self.registers
+        flags = self.flags
+        value1 = registers.A
+        value2 = self.memory[registers.HL]
 
         result = value1 + value2
         new_value = result & 0xFF
-        self.registers.A = new_value
+        registers.A = new_value
 
-        self.set_flags(new_value)
-        self.set_carry_flag(result)
-        self.set_aux_carry_flag(value1, value2)
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (((value1 & 0x0F) + (value2 & 0x0F)) & 0x10)
+            | (result >> 0x08)
+            | ZSP[new_value]
+        )
         self.cycles += 7
 
     @manager.add_instruction(0x88, ["B"])
@@ -598,35 +694,46 @@ class Intel8080(CPU):
     @manager.add_instruction(0x8C, ["H"])
     @manager.add_instruction(0x8D, ["L"])
     @manager.add_instruction(0x8F, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "a_value = registers.A",
+        "reg_value = registers.{0}",
+        "reg_value += flags._flags & 0x01",
+        "result = a_value + reg_value",
+        "flags._flags = (",
+        "    (flags._flags & 0x2A)",
+        "    | (0x10 if ((a_value & 0x0F) + (reg_value & 0x0F)) > 0x0F else 0x00)",
+        "    | ZSP[result & 0xFF]",
+        "    | (result >> 0x08)",
+        ")",
+        "registers.A = result & 0xFF",
+        "cpu.cycles += 4",
+    )
     def adc_reg(self, register: int) -> None:
-        a_value = self.registers.A
-        reg_value = self.registers[register]
-        reg_value += 1 if self.flags.C else 0
-        result = a_value + reg_value
-
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(reg_value)) > 0x0F
-        self.flags.C = result > 0xFF
+        """
+        Add the contents of the specified register and the carry bit to the accumulator.
 
-        self.registers.A = result & 0xFF
-        self.cycles += 4
+        Condition bits affected: Carry, Sign, Zero, Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0x8E)
     def adc_m(self) -> None:
-        a_value = self.registers.A
-        value_2 = self.read_memory_byte(self.registers.HL)
-        value_2 += 1 if self.flags.C else 0
+        registers = self.registers
+        flags = self.flags
+        a_value = registers.A
+        value_2 = self.memory[registers.HL]
+        value_2 += flags._flags & 0x01
         result = a_value + value_2
 
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(value_2)) > 0x0F
-        self.flags.C = result > 0xFF
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (0x10 if ((a_value & 0x0F) + (value_2 & 0x0F)) > 0x0F else 0x00)
+            | ZSP[result & 0xFF]
+            | (result >> 0x08)
+        )
 
-        self.registers.A = result & 0xFF
+        registers.A = result & 0xFF
         self.cycles += 4
 
     @manager.add_instruction(0x90, ["B"])
@@ -636,36 +743,45 @@ class Intel8080(CPU):
     @manager.add_instruction(0x94, ["H"])
     @manager.add_instruction(0x95, ["L"])
     @manager.add_instruction(0x97, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "a_value = registers.A",
+        "reg_value = registers.{0}",
+        "result = a_value - reg_value",
+        "flags._flags = (",
+        "    (flags._flags & 0x2A)",
+        "    | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (reg_value & 0x0F)]",
+        "    | ZSP[result & 0xFF]",
+        "    | ((result >> 0x08) & 0x01)",
+        ")",
+        "registers.A = result & 0xFF",
+        "cpu.cycles += 4",
+    )
     def sub_reg(self, register: int) -> None:
-        a_value = self.registers.A
-        reg_value = self.registers[register]
-        compl = get_twos_complement(reg_value)
-        result = a_value + compl
-
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(compl)) > 0x0F
-        self.flags.C = result <= 0xFF
+        """
+        Subtract the contents of the specified register from the accumulator.
 
-        self.registers.A = result & 0xFF
-        self.cycles += 4
+        Condition bits affected: Carry, Sign, Zero, Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0x96)
     def sub_m(self) -> None:
-        a_value = self.registers.A
-        value_2 = self.read_memory_byte(self.registers.HL)
-
-        compl = get_twos_complement(value_2)
-        result = a_value + compl
-
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(compl)) > 0x0F
-        self.flags.C = result <= 0xFF
+        registers = self.registers
+        flags = self.flags
+        a_value = registers.A
+        value_2 = self.memory[registers.HL]
+
+        result = a_value - value_2
+
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (value_2 & 0x0F)]
+            | ZSP[result & 0xFF]
+            | ((result >> 0x08) & 0x01)
+        )
 
-        self.registers.A = result & 0xFF
+        registers.A = result & 0xFF
         self.cycles += 4
 
     @manager.add_instruction(0x98, ["B"])
@@ -675,39 +791,47 @@ class Intel8080(CPU):
     @manager.add_instruction(0x9C, ["H"])
     @manager.add_instruction(0x9D, ["L"])
     @manager.add_instruction(0x9F, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "a_value = registers.A",
+        "reg_value = registers.{0}",
+        "reg_value += flags._flags & 0x01",
+        "result = a_value - reg_value",
+        "registers.A = result & 0xFF",
+        "flags._flags = (",
+        "    (flags._flags & 0x2A)",
+        "    | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (reg_value & 0x0F)]",
+        "    | ZSP[result & 0xFF]",
+        "    | ((result >> 0x08) & 0x01)",
+        ")",
+        "cpu.cycles += 4",
+    )
     def sbb_reg(self, register: int):
-        a_value = self.registers.A
-        reg_value = self.registers[register]
-
-        reg_value += 1 if self.flags.C else 0
-        compl = get_twos_complement(reg_value)
-
-        result = a_value + compl
-        self.registers.A = result & 0xFF
-
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
+        """
+        Subtract the contents of the specified register and the carry bit from the
+        accumulator.
 
-        self.flags.C = result <= 0xFF
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(compl)) > 0x0F
-        self.cycles += 4
+        Condition bits affected: Carry, Sign, Zero, Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0x9E)
     def sbb_m(self):
-        a_value = self.registers.A
-        value_2 = self.read_memory_byte(self.registers.HL)
-        value_2 += 1 if self.flags.C else 0
-        compl = get_twos_complement(value_2)
-
-        result = a_value + compl
-        self.registers.A = result & 0xFF
-
-        self.flags.S = (result & 0x80) != 0x00
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
-        self.flags.C = result <= 0xFF
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(compl)) > 0x0F
+        registers = self.registers
+        flags = self.flags
+        a_value = registers.A
+        value_2 = self.memory[registers.HL]
+        value_2 += flags._flags & 0x01
+
+        result = a_value - value_2
+        registers.A = result & 0xFF
+
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (value_2 & 0x0F)]
+            | ZSP[result & 0xFF]
+            | ((result >> 0x08) & 0x01)
+        )
         self.cycles += 4
 
     @manager.add_instruction(0xA0, ["B"])
@@ -717,31 +841,43 @@ class Intel8080(CPU):
     @manager.add_instruction(0xA4, ["H"])
     @manager.add_instruction(0xA5, ["L"])
     @manager.add_instruction(0xA7, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "a_value = registers.A",
+        "value2 = registers.{0}",
+        "result = a_value & value2",
+        "registers.A = result",
+        "flags._flags = (",
+        "    (flags._flags & 0x2A)",
+        "    | (0x10 if ((a_value & 0x0F) + (value2 & 0x0F)) > 0xF else 0x00)",
+        "    | ZSP[result & 0xFF]",
+        ")",
+        "cpu.cycles += 4",
+    )
     def ana_reg(self, register: int) -> None:
-        a_value = self.registers.A
-        value2 = self.registers[register]
-        result = a_value & value2
-        self.registers.A = result
-
-        self.flags.S = (result & 0x80) != 0
-        self.flags.Z = (result & 0xFF) == 0
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
-        self.flags.C = False
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(value2)) > 0xF
+        """
+        Logical AND of the specified register with the accumulator.
 
-        self.cycles += 4
+        The carry bit is reset. Condition bits affected: Carry, Sign, Zero, Parity,
+        Auxiliary Carry.
+        """
 
     @manager.add_instruction(0xA6)
     def and_memory_to_accumulator(self) -> None:
-        value1 = self.registers.A
-        value2 = self.read_memory_byte(self.registers.HL)
+        registers = self.registers
+        flags = self.flags
+        value1 = registers.A
+        value2 = self.memory[registers.HL]
 
         result = value1 & value2
-        self.registers.A = result
+        registers.A = result
 
-        self.set_flags(result)
-        self.set_aux_carry_flag(value1, value2)
-        self.flags.C = False
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (0x10 if (value1 & 0x0F) + (value2 & 0x0F) > 0x0F else 0x00)
+            | ZSP[result]
+        )
         self.cycles += 7
 
     @manager.add_instruction(0xA8, ["B"])
@@ -751,32 +887,35 @@ class Intel8080(CPU):
     @manager.add_instruction(0xAC, ["H"])
     @manager.add_instruction(0xAD, ["L"])
     @manager.add_instruction(0xAF, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "value1 = registers.A",
+        "value2 = registers.{0}",
+        "result = value1 ^ value2",
+        "registers.A = result",
+        "flags._flags = (flags._flags & 0x3A) | ZSP[result & 0xFF]",
+        "cpu.cycles += 4",
+    )
     def xra(self, register: int) -> None:
-        value1 = self.registers.A
-        value2 = self.registers[register]
-
-        result = value1 ^ value2
-        self.registers.A = result
+        """
+        Logical exclusive-OR of the specified register with the accumulator.
 
-        self.flags.S = (result & 0x80) != 0
-        self.flags.Z = (result & 0xFF) == 0
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
-        self.flags.C = False
-        self.cycles += 4
+        The carry and auxiliary carry bits are reset. Condition bits affected: Carry,
+        Sign, Zero, Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0xAE)
     def xra_m(self) -> None:
-        value1 = self.registers.A
-        value_2 = self.read_memory_byte(self.registers.HL)
+        registers = self.registers
+        flags = self.flags
+        value1 = registers.A
+        value_2 = self.memory[registers.HL]
 
         result = value1 ^ value_2
-        self.registers.A = result
+        registers.A = result
 
-        self.flags.S = (result & 0x80) != 0
-        self.flags.Z = (result & 0xFF) == 0
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
-        self.flags.A = False
-        self.flags.C = False
+        flags._flags = (flags._flags & 0x2A) | ZSP[result & 0xFF]
         self.cycles += 4
 
     @manager.add_instruction(0xB0, ["B"])
@@ -786,16 +925,21 @@ class Intel8080(CPU):
     @manager.add_instruction(0xB4, ["H"])
     @manager.add_instruction(0xB5, ["L"])
     @manager.add_instruction(0xB7, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "result = registers.A | registers.{0}",
+        "registers.A = result",
+        "flags._flags = (flags._flags & 0x2A) | ZSP[result & 0xFF]",
+        "cpu.cycles += 4",
+    )
     def ora_reg(self, register: int) -> None:
-        result = self.registers.A | self.registers[register]
-        self.registers.A = result
-
-        self.flags.S = (result & 0x80) != 0
-        self.flags.Z = (result & 0xFF) == 0
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
-        self.flags.C = False
-        self.flags.A = False
-        self.cycles += 4
+        """
+        Logical OR of the specified register with the accumulator.
+
+        The carry and auxiliary carry bits are reset. Condition bits affected: Carry,
+        Sign, Zero, Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0xB6)
     def ora_m(self) -> None:
@@ -804,13 +948,14 @@ class Intel8080(CPU):
         contents of the accumulator.
         The carry bit is reset to zero.
         """
-        address = self.registers.HL
-        value = self.read_memory_byte(address)
-        result = self.registers.A | value
-        self.registers.A = result
-
-        self.set_flags(result)
-        self.flags.C = False
+        registers = self.registers
+        flags = self.flags
+        address = registers.HL
+        value = self.memory[address]
+        result = registers.A | value
+        registers.A = result
+
+        flags._flags = (flags._flags & 0x3A) | ZSP[result]
         self.cycles += 7
 
     @manager.add_instruction(0xB8, ["B"])
@@ -820,56 +965,68 @@ class Intel8080(CPU):
     @manager.add_instruction(0xBC, ["H"])
     @manager.add_instruction(0xBD, ["L"])
     @manager.add_instruction(0xBF, ["A"])
+    @manager.inline(
+        "registers = cpu.registers",
+        "flags = cpu.flags",
+        "a_value = registers.A",
+        "reg_value = registers.{0}",
+        "result = a_value - reg_value",
+        "flags._flags = (",
+        "    (flags._flags & 0x2A)",
+        "    | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (reg_value & 0x0F)]",
+        "    | ZSP[result & 0xFF]",
+        "    | ((result >> 0x08) & 0x01)",
+        ")",
+        "cpu.cycles += 4",
+    )
     def cmp_reg(self, register: int) -> None:
-        a_value = self.registers.A
-        reg_value = self.registers[register]
-        compl = get_twos_complement(reg_value)
-        result = a_value + compl
-
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.S = (result & 0x80) != 0
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.C = result <= 0xFF
+        """
+        Compare the specified register with the accumulator.
 
-        self.flags.A = (get_ls_nib(a_value) + get_ls_nib(compl)) > 0x0F
-        self.cycles += 4
+        The register is subtracted from the accumulator to set the condition bits, the
+        accumulator is left unchanged. Condition bits affected: Carry, Sign, Zero,
+        Parity, Auxiliary Carry.
+        """
 
     @manager.add_instruction(0xBE)
     def cmp_m(self) -> None:
+        registers = self.registers
         self.compare_with_twos_complement(
-            self.registers.A,
-            self.read_memory_byte(self.registers.HL),
+            registers.A,
+            self.memory[registers.HL],
         )
         self.cycles += 7
 
     @manager.add_instruction(0xC0)
     def rnz(self) -> None:
-        if not self.flags.Z:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-
-        self.cycles += 5
+        self._cond_ret(not self.flags._flags & 0x40)
 
     @manager.add_instruction(0xC1, ["B", "C"])
     @manager.add_instruction(0xD1, ["D", "E"])
     @manager.add_instruction(0xE1, ["H", "L"])
+    @manager.inline(
+        "sp = cpu.SP",
+        "memory = cpu.memory",
+        "cpu.SP = (sp + 0x02) & 0xFFFF",
+        "registers = cpu.registers",
+        "registers.{1} = memory[sp]",
+        "registers.{0} = memory[(sp + 0x01) & 0xFFFF]",
+        "cpu.cycles += 10",
+    )
     def pop(self, h: int, l: int) -> None:
         """
         Pop two bytes from the stack and store them in the specified registers pair.
         The stack pointer is incremented by two after the pop.
         """
-        high, low = self._pop()
-        self.registers[h], self.registers[l] = high, low
-        self.cycles += 10
 
     @manager.add_instruction(0xC2)
     def jnz_addr(self) -> None:
-        address = self.fetch_word()
-        if not self.flags.Z:
-            self.PC = address
-
+        pc = self.PC
+        if not self.flags._flags & 0x40:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        else:
+            self.PC = pc + 0x02
         self.cycles += 10
 
     @manager.add_instruction(0xC3)
@@ -881,24 +1038,28 @@ class Intel8080(CPU):
         program counter (PC) to that address, effectively jumping to the
         instruction at that location.
         """
-        address = self.fetch_word()
-        self.PC = address
+        pc = self.PC
+        memory = self.memory
+        self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
         self.cycles += 10
 
     @manager.add_instruction(0xC4)
     def cnz_addr(self) -> None:
-        address = self.fetch_word()
-        if not self.flags.Z:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-        self.cycles += 11
+        self._cond_call(not self.flags._flags & 0x40)
 
     @manager.add_instruction(0xC5, ["BC"])
     @manager.add_instruction(0xD5, ["DE"])
     @manager.add_instruction(0xE5, ["HL"])
+    @manager.inline(
+        "value = cpu.registers.{0}",
+        "sp = (cpu.SP - 0x02) & 0xFFFF",
+        "cpu.SP = sp",
+        "memory = cpu.memory",
+        "memory[sp] = value & 0xFF",
+        "sp = (sp + 0x01) & 0xFFFF",
+        "memory[sp] = value >> 0x08",
+        "cpu.cycles += 11",
+    )
     def push(self, register: str) -> None:
         """
         Push the contents of the BC register pair onto the stack.
@@ -907,9 +1068,6 @@ class Intel8080(CPU):
         The value in the C register is pushed first as the low byte, followed by the
         value in the B register as the high byte.
         """
-        h, l = split_word(self.registers[register])
-        self._push(h, l)
-        self.cycles += 11
 
     @manager.add_instruction(0xC6)
     def adi_d8(self) -> None:
@@ -920,28 +1078,27 @@ class Intel8080(CPU):
         Condition bits affected: Carry, Sign, Zero,
         Parity, Auxiliary Carry.
         """
+        registers = self.registers
+        flags = self.flags
         i_value = self.fetch_byte()
-        a_value = self.registers.A
+        a_value = registers.A
         result = i_value + a_value
         new_value = result & 0xFF
 
-        self.registers.A = new_value
+        registers.A = new_value
 
-        self.set_flags(new_value)
-        self.set_carry_flag(result)
-        self.set_aux_carry_flag(i_value, a_value)
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (0x10 if (i_value & 0x0F) + (a_value & 0x0F) > 0x0F else 0x00)
+            | (result >> 0x08)
+            | ZSP[new_value]
+        )
 
         self.cycles += 7
 
     @manager.add_instruction(0xC8)
     def rz(self) -> None:
-        if self.flags.Z:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-
-        self.cycles += 5
+        self._cond_ret(self.flags._flags & 0x40)
 
     @manager.add_instruction(0xC9)
     def ret(self) -> None:
@@ -954,28 +1111,25 @@ class Intel8080(CPU):
         followed by the low byte, and they are combined to form the
         complete address.
         """
-        h, l = self._pop()
-        self.PC = h << 0x08 | l & 0xFF
+        sp = self.SP
+        memory = self.memory
+        self.SP = (sp + 0x02) & 0xFFFF
+        self.PC = (memory[(sp + 0x01) & 0xFFFF] << 0x08) | memory[sp]
         self.cycles += 10
 
     @manager.add_instruction(0xCA)
     def jz_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.Z:
-            self.PC = address
+        pc = self.PC
+        if self.flags._flags & 0x40:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        else:
+            self.PC = pc + 0x02
         self.cycles += 10
 
     @manager.add_instruction(0xCC)
     def cz_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.Z:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-
-        self.cycles += 11
+        self._cond_call(self.flags._flags & 0x40)
 
     @manager.add_instruction(0xCD)
     def call_addr(self) -> None:
@@ -990,50 +1144,81 @@ class Intel8080(CPU):
         The fetch_word method is used to retrieve the 16-bit address from memory, and the current PC
         is split into high and low bytes and pushed onto the stack.
         """
-        address_to_jump = self.fetch_word()
-        h, l = split_word(self.PC)
-        self._push(h, l)
+        pc = self.PC
+        memory = self.memory
+        address_to_jump = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        pc += 0x02
+        sp = (self.SP - 0x02) & 0xFFFF
+        self.SP = sp
+        memory[sp] = pc & 0xFF
+        sp = (sp + 0x01) & 0xFFFF
+        memory[sp] = (pc >> 0x08) & 0xFF
         self.PC = address_to_jump
         self.cycles += 17
 
     @manager.add_instruction(0xCE)
     def aci_d8(self):
-        value1 = self.registers.A
+        registers = self.registers
+        flags = self.flags
+        value1 = registers.A
         value2 = self.fetch_byte()
 
-        result = value1 + value2 + self.flags.C
-        self.registers.A = result & 0xFF
-
-        self.flags.C = result > 0xFF
-        self.flags.Z = self.registers.A == 0
-        self.flags.S = self.registers.A & 0x80 != 0x00
-        self.flags.P = bin(result & 0xFF).count("1") % 2 == 0
-        self.flags.A = (get_ls_nib(value1) + get_ls_nib(value2) + self.flags.C) > 0x0F
+        result = value1 + value2 + (flags._flags & 0x01)
+        registers.A = result & 0xFF
+
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (
+                0x10
+                if ((value1 & 0x0F) + (value2 & 0x0F) + (result >> 0x08)) > 0x0F
+                else 0x00
+            )
+            | ZSP[result & 0xFF]
+            | (result >> 0x08)
+        )
         self.cycles += 7
 
-    @manager.add_instruction(0xCF)
-    def rst_1(self) -> None:
-        if self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x08
-            self.cycles += 11
+    @manager.add_instruction(0xCF, [0x08])
+    @manager.add_instruction(0xD7, [0x10])
+    @manager.add_instruction(0xDF, [0x18])
+    @manager.add_instruction(0xE7, [0x20])
+    @manager.add_instruction(0xEF, [0x28])
+    @manager.add_instruction(0xF7, [0x30])
+    @manager.add_instruction(0xFF, [0x38])
+    @manager.inline(
+        "if cpu.interrupts_enabled:",
+        "    cpu.interrupts_enabled = False",
+        "    pc = cpu.PC",
+        "    sp = (cpu.SP - 0x02) & 0xFFFF",
+        "    cpu.SP = sp",
+        "    memory = cpu.memory",
+        "    memory[sp] = pc & 0xFF",
+        "    sp = (sp + 0x01) & 0xFFFF",
+        "    memory[sp] = (pc >> 0x08) & 0xFF",
+        "    cpu.PC = {0}",
+        "    cpu.cycles += 11",
+    )
+    def rst(self, address: int) -> None:
+        """
+        Restart at the given vector address.
+
+        The current PC is pushed to the stack and execution continues
+        at address (8 * n for RST n). Only taken while interrupts are enabled,
+        which also get disabled.
+        """
 
     @manager.add_instruction(0xD0)
     def rnc(self) -> None:
-        if not self.flags.C:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-        self.cycles += 5
+        self._cond_ret(not self.flags._flags & 0x01)
 
     @manager.add_instruction(0xD2)
     def jnc_addr(self) -> None:
-        address = self.fetch_word()
-        if not self.flags.C:
-            self.PC = address
+        pc = self.PC
+        if not self.flags._flags & 0x01:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        else:
+            self.PC = pc + 0x02
         self.cycles += 10
 
     @manager.add_instruction(0xD3)
@@ -1043,171 +1228,119 @@ class Intel8080(CPU):
         self.cycles += 10
 
     @manager.add_instruction(0xD4)
-    def cnc_addr(self):
-        address = self.fetch_word()
-        if not self.flags.C:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-        self.cycles += 11
+    def cnc_addr(self) -> None:
+        self._cond_call(not self.flags._flags & 0x01)
 
     @manager.add_instruction(0xD6)
     def sui_d8(self) -> None:
+        registers = self.registers
+        flags = self.flags
         i_value = self.fetch_byte()
-        a_value = self.registers.A
+        a_value = registers.A
         result = a_value - i_value
         new_value = result & 0xFF
-        self.registers.A = new_value
-        self.set_flags(new_value)
-        self.set_carry_flag(result)
-        # twos complement
-        x = (i_value ^ 0xFF) + 0x01
-        c = ((x & 0xF) + (a_value & 0xF)) > 0xF
-        self.flags.A = c
+        registers.A = new_value
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (i_value & 0x0F)]
+            | ((result >> 0x08) & 0x01)
+            | ZSP[new_value]
+        )
         self.cycles += 7
 
-    @manager.add_instruction(0xD7)
-    def rst_2(self) -> None:
-        if self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x10
-            self.cycles += 11
-
     @manager.add_instruction(0xD8)
     def rc(self) -> None:
-        if self.flags.C:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-        self.cycles += 5
+        self._cond_ret(self.flags._flags & 0x01)
 
     @manager.add_instruction(0xDA)
     def jc_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.C:
-            self.PC = address
+        pc = self.PC
+        if self.flags._flags & 0x01:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        else:
+            self.PC = pc + 0x02
         self.cycles += 10
 
     @manager.add_instruction(0xDB)
-    def in_d8(self) -> int:
+    def in_d8(self) -> None:
         port = self.fetch_byte()
         self.registers.A = self.bus.read(port)
         self.cycles += 10
 
     @manager.add_instruction(0xDC)
-    def cc_addr(self):
-        address = self.fetch_word()
-        if self.flags.C:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-        self.cycles += 11
+    def cc_addr(self) -> None:
+        self._cond_call(self.flags._flags & 0x01)
 
     @manager.add_instruction(0xDE)
     def sbi_d8(self) -> None:
-        carry = 1 if self.flags.C else 0
+        registers = self.registers
+        flags = self.flags
+        carry = flags._flags & 0x01
         i_value = self.fetch_byte()
         i_value += carry
         i_value &= 0xFF
 
-        a_value = self.registers.A
+        a_value = registers.A
         result = a_value - i_value
         new_value = result & 0xFF
 
-        self.registers.A = new_value
-        self.set_flags(new_value)
-        self.set_carry_flag(result)
-
-        # twos complement
-        x = (i_value ^ 0xFF) + 0x01
-
-        c = ((x & 0xF) + (a_value & 0xF)) > 0xF
-        self.flags.A = c
+        registers.A = new_value
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (i_value & 0x0F)]
+            | ((result >> 0x08) & 0x01)
+            | ZSP[new_value]
+        )
         self.cycles += 7
 
-    @manager.add_instruction(0xDF)
-    def rst_3(self) -> None:
-        if self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x08 * 3
-            self.cycles += 11
-
     @manager.add_instruction(0xE0)
     def rpo(self) -> None:
-        if not self.flags.P:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-        self.cycles += 5
+        self._cond_ret(not self.flags._flags & 0x04)
 
     @manager.add_instruction(0xE2)
     def jpo_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.P:
-            self.PC = address
+        pc = self.PC
+        if self.flags._flags & 0x04:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
             self.cycles += 17
             return
+        self.PC = pc + 0x02
         self.cycles += 11
 
     @manager.add_instruction(0xE3)
     def xthl(self) -> None:
-        h, l = self.registers.H, self.registers.L
-        self.registers.L = self.read_memory_byte(self.SP)
-        self.registers.H = self.read_memory_byte(self.SP + 0x01)
+        registers = self.registers
+        h, l = registers.H, registers.L
+        registers.H, registers.L = self.read_memory_word_bytes(self.SP)
         self.write_memory_word(self.SP, h, l)
         self.cycles += 18
 
     @manager.add_instruction(0xE4)
     def cpo_addr(self) -> None:
-        address = self.fetch_word()
-        if not self.flags.P:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-        self.cycles += 11
+        self._cond_call(not self.flags._flags & 0x04)
 
     @manager.add_instruction(0xE6)
     def ani_d8(self) -> None:
-        value1 = self.registers.A
+        registers = self.registers
+        flags = self.flags
+        value1 = registers.A
         value2 = self.fetch_byte()
 
         result = value1 & value2
-        self.registers.A = result
+        registers.A = result
 
-        self.set_flags(result)
-        self.flags.C = False
-        self.set_aux_carry_flag(value1, value2)
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (0x10 if (value1 & 0x0F) + (value2 & 0x0F) > 0x0F else 0x00)
+            | ZSP[result]
+        )
         self.cycles += 7
 
-    @manager.add_instruction(0xE7)
-    def rst_4(self) -> None:
-        if self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x20
-            self.cycles += 11
-
     @manager.add_instruction(0xE8)
     def rpe(self) -> None:
-        if self.flags.P:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-        self.cycles += 5
+        self._cond_ret(self.flags._flags & 0x04)
 
     @manager.add_instruction(0xE9)
     def pchl(self) -> None:
@@ -1216,11 +1349,13 @@ class Intel8080(CPU):
 
     @manager.add_instruction(0xEA)
     def jpe_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.P:
-            self.PC = address
+        pc = self.PC
+        if self.flags._flags & 0x04:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
             self.cycles += 10
             return
+        self.PC = pc + 0x02
         self.cycles += 5
 
     @manager.add_instruction(0xEB)
@@ -1231,65 +1366,46 @@ class Intel8080(CPU):
 
         Condition bits affected: None
         """
-        self.registers.HL, self.registers.DE = self.registers.DE, self.registers.HL
+        registers = self.registers
+        registers.H, registers.D = registers.D, registers.H
+        registers.L, registers.E = registers.E, registers.L
         self.cycles += 5
 
     @manager.add_instruction(0xEC)
     def cpe_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.P:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-
-        self.cycles += 11
+        self._cond_call(self.flags._flags & 0x04)
 
     @manager.add_instruction(0xEE)
     def xri_d8(self):
-        value1 = self.registers.A
+        registers = self.registers
+        flags = self.flags
+        value1 = registers.A
         value2 = self.fetch_byte()
 
         result = value1 ^ value2
-        self.registers.A = result
+        registers.A = result
 
-        self.flags.S = (result & 0x80) != 0
-        self.flags.Z = (result & 0xFF) == 0x00
-        self.flags.P = (bin(result & 0xFF).count("1") % 2) == 0
-        self.flags.A = False
-        self.flags.C = False
+        flags._flags = (flags._flags & 0x2A) | ZSP[result & 0xFF]
         self.cycles += 7
 
-    @manager.add_instruction(0xEF)
-    def rst_5(self) -> None:
-        if self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x08 * 5
-            self.cycles += 11
-
     @manager.add_instruction(0xF0)
     def rp(self) -> None:
-        if self.flags.P:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-        self.cycles += 5
+        self._cond_ret(self.flags._flags & 0x04)
 
     @manager.add_instruction(0xF1)
     def pop_psw(self) -> None:
         self.registers.A, flags_byte = self._pop()
-        self.flags.set_flags(flags_byte)
+        self.flags._flags = flags_byte | 0x02  # Second bit is always set
         self.cycles += 10
 
     @manager.add_instruction(0xF2)
-    def jp_addr(self):
-        address = self.fetch_word()
-        if not self.flags.S:
-            self.PC = address
+    def jp_addr(self) -> None:
+        pc = self.PC
+        if not self.flags._flags & 0x80:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        else:
+            self.PC = pc + 0x02
         self.cycles += 10
 
     @manager.add_instruction(0xF3)
@@ -1299,50 +1415,33 @@ class Intel8080(CPU):
 
     @manager.add_instruction(0xF4)
     def cp_addr(self) -> None:
-        address = self.fetch_word()
-        if not self.flags.S:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-        self.cycles += 11
+        self._cond_call(not self.flags._flags & 0x80)
 
     @manager.add_instruction(0xF5)
     def push_psw(self) -> None:
-        self._push(self.registers.A, self.flags.get_flags())
+        self._push(self.registers.A, self.flags._flags)
         self.cycles += 11
 
     @manager.add_instruction(0xF6)
     def ori_d8(self) -> None:
+        registers = self.registers
+        flags = self.flags
         i_value = self.fetch_byte()
-        a_value = self.registers.A
+        a_value = registers.A
         result = a_value | i_value
-        self.registers.A = result
+        registers.A = result
 
-        self.set_flags(result)
-        self.set_carry_flag(result)
-        self.set_aux_carry_flag(a_value, i_value)
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | (0x10 if (a_value & 0x0F) + (i_value & 0x0F) > 0x0F else 0x00)
+            | ZSP[result]
+        )
 
         self.cycles += 7
 
-    @manager.add_instruction(0xF7)
-    def rst_6(self) -> None:
-        if self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x30
-            self.cycles += 11
-
     @manager.add_instruction(0xF8)
     def rm(self) -> None:
-        if self.flags.S:
-            h, l = self._pop()
-            self.PC = join_bytes(h, l)
-            self.cycles += 11
-            return
-        self.cycles += 5
+        self._cond_ret(self.flags._flags & 0x80)
 
     @manager.add_instruction(0xF9)
     def sphl(self) -> None:
@@ -1351,10 +1450,12 @@ class Intel8080(CPU):
 
     @manager.add_instruction(0xFA)
     def jm_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.S:
-            self.PC = address
-
+        pc = self.PC
+        if self.flags._flags & 0x80:
+            memory = self.memory
+            self.PC = (memory[(pc + 0x01) & 0xFFFF] << 0x08) | memory[pc & 0xFFFF]
+        else:
+            self.PC = pc + 0x02
         self.cycles += 10
 
     @manager.add_instruction(0xFB)
@@ -1364,17 +1465,10 @@ class Intel8080(CPU):
 
     @manager.add_instruction(0xFC)
     def cm_addr(self) -> None:
-        address = self.fetch_word()
-        if self.flags.S:
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = address
-            self.cycles += 17
-            return
-        self.cycles += 11
+        self._cond_call(self.flags._flags & 0x80)
 
-    @manager.add_instruction(0xFE, ["A"])
-    def cpi_d8(self, register: int) -> None:
+    @manager.add_instruction(0xFE)
+    def cpi_d8(self) -> None:
         """
         The byte of immediate data is compared to the contents of the accumulator.
         The comparison is performed by internally subtracting the data from the
@@ -1384,14 +1478,15 @@ class Intel8080(CPU):
         Since a subtract operation is performed, the Carry bit will be set if
         there is no carry out of bit 7.
         """
-        self.compare_with_twos_complement(self.registers[register], self.fetch_byte())
+        flags = self.flags
+        a_value = self.registers.A
+        value = self.fetch_byte()
+        result = a_value - value
+
+        flags._flags = (
+            (flags._flags & 0x2A)
+            | SUB_AUX_CARRY[((a_value & 0x0F) << 0x04) | (value & 0x0F)]
+            | ZSP[result & 0xFF]
+            | ((result >> 0x08) & 0x01)
+        )
         self.cycles += 7
-
-    @manager.add_instruction(0xFF)
-    def rst_7(self) -> None:
-        if not self.interrupts_enabled:
-            self.interrupts_enabled = False
-            h, l = split_word(self.PC)
-            self._push(h, l)
-            self.PC = 0x38
-            self.cycles += 11
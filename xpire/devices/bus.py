@@ -34,28 +34,32 @@ class Bus:
         }
 
     def _read_device(self, address: int) -> int:
-        if not address in self.devices:
-            raise InvalidReadAddress(address)
+        try:
+            device = self.devices[address]
+        except KeyError:
+            raise InvalidReadAddress(address) from None
 
-        return self.devices[address].read()
+        return device.read()
 
     def _write_device(self, address: int, value: int, port: int):
-        if not address in self.devices:
-            raise InvalidWriteAddress(address)
+        try:
+            device = self.devices[address]
+        except KeyError:
+            raise InvalidWriteAddress(address) from None
 
-        self.devices[address].write(value, port)
+        device.write(value, port)
 
     def _get_read_port_address(self, port: int) -> int:
-        if port not in self.read_mapping:
-            raise InvalidReadPort(port)
-
-        return self.read_mapping[port]
+        try:
+            return self.read_mapping[port]
+        except KeyError:
+            raise InvalidReadPort(port) from None
 
     def _get_write_port_addresss(self, port: int) -> int:
-        if port not in self.write_mapping:
-            raise InvalidWritePort(port)
-
-        return self.write_mapping[port]
+        try:
+            return self.write_mapping[port]
+        except KeyError:
+            raise InvalidWritePort(port) from None
 
     def add_device(self, address: int, device: Device):
         self.devices[address] = device
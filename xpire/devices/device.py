@@ -26,16 +26,16 @@ class P1Controls(Device):
 
 class Shifter(Device):
     def __init__(self):
-        self._value = 0x00
-        self._offset = 0x00
+        self._value = 0x0000
+        self._shift = 0x08
 
     def write(self, value, port: Optional[int] = None):
-        if port == 0x02:
-            self._offset = (value ^ 0xFF) & 0x07
-        elif port == 0x04:
-            self._value = (self._value >> 8) | (value << 7)
+        if port == 0x04:
+            self._value = (self._value >> 8) | (value << 8)
+        elif port == 0x02:
+            self._shift = 8 - (value & 0x07)
         else:
             raise Exception(f"Invalid port {port}")
 
     def read(self):
-        return (self._value >> self._offset) & 0xFF
+        return (self._value >> self._shift) & 0xFF
@@ -46,6 +46,12 @@ class GameManager:
         self.scene = scene
         self.clock = pygame.time.Clock()
         self.screen = pygame.display.set_mode(self.screen_size)
+        # handle_events reads QUIT and KEYDOWN only.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        self.scaled_surface = None
+        self.frame_position = (0, 0)
+        self.font = None
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -57,7 +63,10 @@ class GameManager:
                     pygame.display.toggle_fullscreen()
 
     def print_debug_info(self) -> None:
-        my_font = pygame.font.Font("space_invaders.ttf", 20)
+        my_font = self.font
+        if my_font is None:
+            # Loading the font parses the TTF file, do it only once.
+            my_font = self.font = pygame.font.Font("space_invaders.ttf", 20)
         offset = 500
 
         time_surface = my_font.render(
@@ -70,6 +79,23 @@ class GameManager:
         )
         self.screen.blit(time_surface, (30, 50 + offset))
 
+    def scale_frame(self, frame: Surface) -> Surface:
+        """
+        Scale the frame to twice its size.
+
+        The scaled surface and the position that centers it on the screen
+        are only computed again when the frame size changes.
+        """
+        surface = self.scaled_surface
+        size = (frame.get_width() * 2, frame.get_height() * 2)
+        if surface is None or surface.get_size() != size:
+            surface = self.scaled_surface = pygame.Surface(size, 0, frame)
+            self.frame_position = (
+                self.screen.get_width() // 2 - size[0] // 2,
+                self.screen.get_height() // 2 - size[1] // 2,
+            )
+        return pygame.transform.scale(frame, size, surface)
+
     def start(self):
         running = True
         while running:
@@ -78,14 +104,8 @@ class GameManager:
             frame: Surface = self.scene.update()
 
             self.handle_events()
-            surface = pygame.transform.scale(
-                frame,
-                (frame.get_width() * 2, frame.get_height() * 2),
-            )
-
-            x_position = self.screen.get_width() // 2 - surface.get_width() // 2
-            y_position = self.screen.get_height() // 2 - surface.get_height() // 2
-            self.screen.blit(surface, (x_position, y_position))
+            surface = self.scale_frame(frame)
+            self.screen.blit(surface, self.frame_position)
 
             # self.print_debug_info()
             pygame.display.update()
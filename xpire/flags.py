@@ -11,6 +11,8 @@ class FlagsManager:
     FlagsManager class for the CPU emulator.
     """
 
+    __slots__ = ("_flags",)
+
     _flags: int
 
     def __init__(self):
@@ -25,6 +27,10 @@ class FlagsManager:
         AC: Aux carry flag
         P: Parity flag
         C: Carry flag
+
+        The CPU helpers that update several flags at once write `_flags`
+        directly with a single store, the properties below are kept for
+        single-flag access.
         """
         self.clear_flags()
 
@@ -101,40 +107,55 @@ class FlagsManager:
 
     @property
     def C(self) -> bool:
-        return self.check_flag(0x01)
+        return bool(self._flags & 0x01)
 
     @C.setter
     def C(self, value: bool) -> None:
-        self.set_flag(0x01, value)
+        if value:
+            self._flags |= 0x01
+        else:
+            self._flags &= ~0x01
 
     @property
     def P(self) -> bool:
-        return self.check_flag(0x04)
+        return bool(self._flags & 0x04)
 
     @P.setter
     def P(self, value: bool) -> None:
-        self.set_flag(0x04, value)
+        if value:
+            self._flags |= 0x04
+        else:
+            self._flags &= ~0x04
 
     @property
     def A(self) -> bool:
-        return self.check_flag(0x10)
+        return bool(self._flags & 0x10)
 
     @A.setter
     def A(self, value: bool) -> None:
-        self.set_flag(0x10, value)
+        if value:
+            self._flags |= 0x10
+        else:
+            self._flags &= ~0x10
 
     @property
     def Z(self) -> bool:
-        return self.check_flag(0x40)
+        return bool(self._flags & 0x40)
 
     @Z.setter
     def Z(self, value: bool) -> None:
-        self.set_flag(0x40, value)
+        if value:
+            self._flags |= 0x40
+        else:
+            self._flags &= ~0x40
 
     @property
     def S(self) -> bool:
-        return self.check_flag(0x80)
+        return bool(self._flags & 0x80)
 
     @S.setter
     def S(self, value: bool) -> None:
-        self.set_flag(0x80, value)
+        if value:
+            self._flags |= 0x80
+        else:
+            self._flags &= ~0x80
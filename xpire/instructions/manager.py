@@ -6,8 +6,20 @@ with its opcode and registers, and to execute an instruction with its opcode.
 
 The instructions are stored in a dictionary where the keys are the opcodes and the
 values are tuples containing the instruction handler and the registers.
+
+Every registered instruction also gets an entry in a flat 256-entry dispatch
+table, so dispatching an opcode is a single list index and call. Handlers
+without registers are their own entry.
+
+Handlers with registers are decorated with `inline` and written as a source
+template of their body. The template is the only implementation: the dispatch
+table entry is compiled from it with the registers substituted, and calling the
+handler method runs the same compiled entry. The generated source is added to
+`linecache`, so tracebacks through it show the lines that ran.
 """
 
+import functools
+import linecache
 from typing import Callable, List, Optional, Tuple
 
 from xpire.cpus.abstract import AbstractCPU
@@ -16,7 +28,118 @@ from xpire.cpus.abstract import AbstractCPU
 class InstructionManager:
     """InstructionManager class."""
 
-    instructions: dict[int, Tuple[Callable, List[str]]] = {}
+    instructions: dict[int, Tuple[Callable, Tuple[str, ...]]] = {}
+    table: List[Callable] = []
+
+    @staticmethod
+    def specialize(opcode: int, func: Callable, registers: Tuple[str, ...]) -> Callable:
+        """
+        Generate the dispatch table entry for an instruction.
+
+        Handlers without registers are stored as they are. `inline` handlers
+        get their template compiled for the registers, so no argument tuple
+        is built or unpacked per call.
+
+        Args:
+            opcode (int): The opcode of the instruction.
+            func (Callable): The instruction handler.
+            registers (Tuple[str, ...]): The registers passed to the handler.
+
+        Returns:
+            Callable: A function taking only the CPU object.
+
+        Raises:
+            Exception: If the handler takes registers but is not `inline`.
+        """
+        specialized = getattr(func, "specialized", None)
+        if specialized is not None:
+            return specialized(registers)
+        if registers:
+            raise Exception(f"Registers without an inline handler: 0x{opcode:02x}")
+        return func
+
+    @staticmethod
+    def compile(name: str, body: str, namespace: dict) -> Callable:
+        """
+        Compile a function of the CPU object from the lines of its body.
+
+        Args:
+            name (str): The name of the function.
+            body (str): The statements of the function, working on `cpu`.
+            namespace (dict): The globals of the function.
+
+        Returns:
+            Callable: The compiled function.
+        """
+        lines = [f"def {name}(cpu):\n"]
+        lines.extend(f"    {line}\n" for line in body.splitlines())
+        filename = f"<{namespace['__name__']}.{name}>"
+        source = "".join(lines)
+        linecache.cache[filename] = (len(source), None, lines, filename)
+        exec(compile(source, filename, "exec"), namespace)
+        return namespace[name]
+
+    @staticmethod
+    def inline(*lines: str) -> Callable:
+        """
+        Implement a handler with a source template of its body.
+
+        Each line is a statement working on `cpu`, `{0}`, `{1}`... are
+        replaced by the registers the opcode was registered with, and
+        `{0[0]}` picks a single register out of a pair name such as "BC".
+        The body sees the globals of the handler module. Must be applied below
+        every `add_instruction` of the handler.
+
+        The decorated function only provides the name, signature and
+        docstring. It is replaced by a method that runs the body compiled for
+        the given registers, which is the same function the dispatch table
+        holds for them.
+
+        Args:
+            *lines (str): The statements of the specialized body.
+
+        Returns:
+            Callable: The decorator.
+        """
+        template = "\n".join(lines)
+
+        def wrapper(func):
+            entries = {}
+
+            def specialized(registers: Tuple) -> Callable:
+                entry = entries.get(registers)
+                if entry is None:
+                    name = "_".join([func.__name__, *map(str, registers)])
+                    entry = entries[registers] = InstructionManager.compile(
+                        name, template.format(*registers), dict(func.__globals__)
+                    )
+                return entry
+
+            @functools.wraps(func)
+            def handler(cpu: AbstractCPU, *registers) -> None:
+                return specialized(registers)(cpu)
+
+            handler.specialized = specialized
+            return handler
+
+        return wrapper
+
+    @staticmethod
+    def unknown(opcode: int) -> Callable:
+        """
+        Generate the dispatch table entry for an unregistered opcode.
+
+        Args:
+            opcode (int): The unknown opcode.
+
+        Returns:
+            Callable: A function that raises when called.
+        """
+
+        def op_unknown(cpu: AbstractCPU) -> None:
+            raise Exception(f"Unknown opcode: 0x{opcode:02x}")
+
+        return op_unknown
 
     @classmethod
     def add_instruction(
@@ -46,7 +169,9 @@ class InstructionManager:
             """
             if opcode in cls.instructions:
                 raise Exception(f"Duplicate opcode: 0x{opcode:02x}")
-            cls.instructions[opcode] = func, registers or []
+            arguments = tuple(registers or ())
+            cls.instructions[opcode] = func, arguments
+            cls.table[opcode] = cls.specialize(opcode, func, arguments)
             return func
 
         return wrapper
@@ -63,8 +188,9 @@ class InstructionManager:
         Raises:
             Exception: If the opcode is unknown.
         """
-        if opcode not in cls.instructions:
-            raise Exception(f"Unknown opcode: 0x{opcode:02x}")
+        cls.table[opcode](cpu)
+
 
-        handler, registers = cls.instructions[opcode]
-        handler(cpu, *registers)
+InstructionManager.table = [
+    InstructionManager.unknown(opcode) for opcode in range(0x100)
+]
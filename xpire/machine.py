@@ -15,6 +15,9 @@ class Machine:
         self.clock = pygame.time.Clock()
         self.cpu = Intel8080()
         self.screen = Screen(width=224, height=256, title="Xpire", scale=3)
+        # process_input only looks at QUIT, SDL drops every other event.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT])
         self.running = False
 
     def has_interruption(self):
@@ -45,8 +48,8 @@ class Machine:
     def load_rom(self, program_path: str) -> bool:
         try:
             with open(program_path, "rb") as f:
-                self.cpu.memory = bytearray(f.read())
-            self.cpu.memory += bytearray(0x10000 - len(self.cpu.memory))
+                rom = f.read()
+            self.cpu.load_program(rom)
             return True
         except FileNotFoundError:
             print(f"ROM not found: {program_path}")
@@ -54,6 +57,20 @@ class Machine:
 
     def run(self):
         self.running = True
-        while self.running and not self.cpu.halted:
-            self.process_interruptions()
-            self.cpu.execute_instruction()
+        cpu = self.cpu
+        process_interruptions = self.process_interruptions
+        execute_instruction = cpu.execute_instruction
+        step_many = cpu.step_many
+        # First cycle count past the refresh interval, where has_interruption
+        # becomes true. The CPU runs up to it in a single batch, and only
+        # steps one instruction at a time while it waits for interrupts to
+        # be enabled again.
+        budget = int(self.screen_refresh_interval) + 1
+        while self.running and not cpu.halted:
+            step_many(budget)
+            if cpu.halted:
+                break
+            if cpu.interrupts_enabled:
+                process_interruptions()
+            else:
+                execute_instruction()
@@ -2,20 +2,12 @@
 Registers for the Intel 8080 CPU.
 
 This module defines the registers used by the Intel 8080 CPU.
-The registers are represented as enum values.
+The registers are stored as slot attributes named after each register.
 """
 
-from xpire.utils import join_bytes, split_word
-
 
 class Registers:
-    A = 0x00
-    B = 0x01
-    C = 0x02
-    D = 0x03
-    E = 0x04
-    H = 0x05
-    L = 0x06
+    __slots__ = ("A", "B", "C", "D", "E", "H", "L")
 
     def __init__(self):
         self.A = 0x00
@@ -28,30 +20,27 @@ class Registers:
 
     @property
     def BC(self):
-        return join_bytes(self.B, self.C)
+        return (self.B << 0x08) | self.C
 
     @BC.setter
     def BC(self, value):
-        self.B, self.C = split_word(value)
+        self.B = (value >> 0x08) & 0xFF
+        self.C = value & 0xFF
 
     @property
     def DE(self):
-        return join_bytes(self.D, self.E)
+        return (self.D << 0x08) | self.E
 
     @DE.setter
     def DE(self, value):
-        self.D, self.E = split_word(value)
+        self.D = (value >> 0x08) & 0xFF
+        self.E = value & 0xFF
 
     @property
     def HL(self):
-        return join_bytes(self.H, self.L)
+        return (self.H << 0x08) | self.L
 
     @HL.setter
     def HL(self, value):
-        self.H, self.L = split_word(value)
-
-    def __getitem__(self, register: str):
-        return getattr(self, register, 0x00)
-
-    def __setitem__(self, register: str, value: int):
-        setattr(self, register, value)
+        self.H = (value >> 0x08) & 0xFF
+        self.L = value & 0xFF
@@ -1,11 +1,10 @@
-import os
-
 import pygame
 
 from xpire.cpus.intel_8080 import Intel8080
 from xpire.devices.bus import Bus
 from xpire.devices.device import Device, P1Controls, Shifter
 from xpire.engine import GameScene
+from xpire.utils import bit_runs
 
 SCREEN_WIDTH = 256
 SCREEN_HEIGHT = 224
@@ -16,6 +15,15 @@ SCREEN_FREQUENCY = 60
 CPU_FREQUENCY = 2000000
 CYCLES_PER_LINE = CPU_FREQUENCY // SCREEN_FREQUENCY // SCREEN_HEIGHT
 
+# Player 1 port bits for each key.
+P1_KEY_MAP = (
+    (pygame.K_c, 0x01),
+    (pygame.K_RETURN, 0x04),
+    (pygame.K_SPACE, 0x10),
+    (pygame.K_LEFT, 0x20),
+    (pygame.K_RIGHT, 0x40),
+)
+
 
 class SpaceInvadersScene(GameScene):
 
@@ -27,32 +35,28 @@ class SpaceInvadersScene(GameScene):
         self.cpu.bus.add_device(Bus.Addresss.P1_CONTROLLER, self.p1_controller)
         self.cpu.bus.add_device(Bus.Addresss.P2_CONTROLLER, Device())
         self.cpu.bus.add_device(Bus.Addresss.DUMMY_DEVICE, Device())
-        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # The screen is mounted rotated 90 degrees, so video memory lines are
+        # drawn as columns from the bottom up.
+        self.surface = pygame.Surface((SCREEN_HEIGHT, SCREEN_WIDTH))
+        # What each column of the surface was last drawn from, as
+        # (bits, background, ink), so unchanged lines are not redrawn.
+        self.drawn_lines = [None] * SCREEN_HEIGHT
 
     def load_rom(self, program_path: str) -> None:
         try:
-            file_size = os.path.getsize(program_path)
-            if file_size > 0xFFFF:
-                raise Exception("ROM is too large, max size is 64kb")
-
             with open(program_path, "rb") as f:
-                self.cpu.memory = bytearray(f.read())
-            self.cpu.memory += bytearray(0x10000 - len(self.cpu.memory))
+                rom = f.read()
+            self.cpu.load_program(rom)
         except FileNotFoundError as e:
             raise Exception(f"ROM not found: {program_path}") from e
 
     def handle_events(self):
-        self.p1_controller.reset()
-        if pygame.key.get_pressed()[pygame.K_c]:
-            self.p1_controller.write(0x01)
-        if pygame.key.get_pressed()[pygame.K_RETURN]:
-            self.p1_controller.write(0x04)
-        if pygame.key.get_pressed()[pygame.K_SPACE]:
-            self.p1_controller.write(0x10)
-        if pygame.key.get_pressed()[pygame.K_LEFT]:
-            self.p1_controller.write(0x20)
-        if pygame.key.get_pressed()[pygame.K_RIGHT]:
-            self.p1_controller.write(0x40)
+        p1_controller = self.p1_controller
+        p1_controller.reset()
+        keys = pygame.key.get_pressed()
+        for key, value in P1_KEY_MAP:
+            if keys[key]:
+                p1_controller.write(value)
 
     def handle_interrupts(self, line_number=0):
         line_number += 1
@@ -62,32 +66,52 @@ class SpaceInvadersScene(GameScene):
             self.cpu.execute_interrupt(0xD7)
 
     def draw_line(self, line):
-        counter = line * SCREEN_LINE_SIZE
-        memory_base = VIDEO_MEMORY_BASE + counter
-        for value in self.cpu.memory[memory_base : memory_base + SCREEN_LINE_SIZE]:
-            x = counter % SCREEN_LINE_SIZE
-            y = counter // SCREEN_LINE_SIZE
-            for i in range(8):
-                if value & (1 << i):
-                    self.surface.set_at((x * 8 + i, y), self.get_ink_color())
-            counter += 1
+        """
+        Draw a line of video memory on the surface.
+
+        The 32 bytes of the line are read as a single little endian integer,
+        so bit x is pixel x of the line. The line is drawn already rotated,
+        as column `line` with pixel x at row SCREEN_WIDTH - 1 - x.
+
+        The column is only redrawn when its bits or colors changed since it
+        was last drawn, most of the video memory stays the same between frames.
+        """
+        memory_base = VIDEO_MEMORY_BASE + line * SCREEN_LINE_SIZE
+        bits = int.from_bytes(
+            self.cpu.memory[memory_base : memory_base + SCREEN_LINE_SIZE], "little"
+        )
+        background = self.get_background_color()
+        color = self.get_ink_color()
+        state = (bits, background, color)
+        drawn_lines = self.drawn_lines
+        if drawn_lines[line] == state:
+            return
+        drawn_lines[line] = state
+
+        fill = self.surface.fill
+        fill(background, (line, 0, 1, SCREEN_WIDTH))
+        for x, run in bit_runs(bits):
+            fill(color, (line, SCREEN_WIDTH - x - run, 1, run))
 
     def get_frame(self):
-        return pygame.transform.rotate(self.surface, 90)
+        return self.surface
 
     def clear_screen(self):
         self.surface.fill(self.get_background_color())
+        self.drawn_lines = [None] * SCREEN_HEIGHT
 
     def update(self) -> pygame.surface.Surface:
         """Update the game state."""
         self.handle_events()
-        self.clear_screen()
 
+        cpu = self.cpu
+        draw_line = self.draw_line
+        handle_interrupts = self.handle_interrupts
+        step_many = cpu.step_many
         cycles = CYCLES_PER_LINE
         for line_number in range(SCREEN_HEIGHT):
-            self.cpu.cycles = 0
-            self.draw_line(line_number)
-            self.handle_interrupts(line_number)
-            while self.cpu.cycles < cycles:
-                self.cpu.execute_instruction()
+            cpu.cycles = 0
+            draw_line(line_number)
+            handle_interrupts(line_number)
+            step_many(cycles)
         return self.get_frame()
@@ -1,7 +1,5 @@
-import pygame
-
 from xpire.constants import Colors
-from xpire.scenes.space_invaders import SCREEN_WIDTH, SpaceInvadersScene
+from xpire.scenes.space_invaders import SpaceInvadersScene
 
 COLOR_PALETE = [
     Colors.BLACK,
@@ -22,15 +20,3 @@ class XpireScene(SpaceInvadersScene):
 
     def get_ink_color(self):
         return Colors.BLACK
-
-    def draw_line(self, line):
-        pygame.draw.line(
-            self.surface,
-            self.get_background_color(),
-            (0, line),
-            (SCREEN_WIDTH, line),
-        )
-        return super().draw_line(line)
-
-    def clear_screen(self):
-        """Clear the screen (Skip)."""
@@ -1,6 +1,7 @@
 import pygame
 
 from xpire.cpus.cpu import AbstractCPU
+from xpire.utils import bit_runs
 
 
 class Screen:
@@ -18,19 +19,20 @@ class Screen:
 
         self.clock = pygame.time.Clock()
 
-        self._screen = pygame.Surface((self.width, self.height))
         self.screen = pygame.display.set_mode(
             (self.width * scale, self.height * scale), pygame.RESIZABLE
         )
+        # Same pixel format as the display, so resize can scale into it.
+        self._screen = pygame.Surface((self.width, self.height), 0, self.screen)
         pygame.display.set_caption(self.title)
-        self.color_table = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
-        self.video_data = []
+        self.font = None
+        # Last (text, surface) rendered on each debug line.
+        self.text_lines = {}
 
     def resize(self) -> None:
-        scaled = pygame.transform.scale(
-            self._screen, (self.screen.get_width(), self.screen.get_height())
-        )
-        self.screen.blit(scaled, (0, 0))
+        # The display surface is the destination of the scale.
+        screen = self.screen
+        pygame.transform.scale(self._screen, screen.get_size(), screen)
 
     def render(self, cpu: AbstractCPU) -> None:
         self.update(cpu)
@@ -39,43 +41,51 @@ class Screen:
         pygame.display.flip()
         self.clock.tick_busy_loop(self.fps)
 
-    def render_pixel(self, pixel_index, x, y) -> None:
-        pixel = self.video_data[pixel_index]
-        if pixel:
-            self._screen.set_at((x, y), (255, 255, 255))
-
-    def rasterize(self, cpu: AbstractCPU) -> None:
-        self.video_data = []
-        for i in range(0x2400, 0x4000):
-            memory_value = cpu.read_memory_byte(i)
-            for j in range(0x08):
-                if memory_value & (1 << j):
-                    self.video_data.append(1)
-                else:
-                    self.video_data.append(0)
-
     def update(self, cpu: AbstractCPU) -> None:
-        self._screen.fill((0, 0, 0))
-        self.rasterize(cpu)
-        counter = 0
+        """
+        Draw the video memory on the screen surface.
+
+        Every column x of the screen is a line of video memory, read as a
+        single little endian integer whose bit y is the pixel at row
+        height - 1 - y.
+        """
+        surface = self._screen
+        surface.fill((0, 0, 0))
+        fill = surface.fill
+        memory = cpu.memory
+        height = self.height
+        line_size = height // 0x08
         for x in range(self.width):
-            for y in reversed(range(self.height)):
-                self.render_pixel(counter, x, y)
-                counter += 1
+            address = 0x2400 + x * line_size
+            bits = int.from_bytes(memory[address : address + line_size], "little")
+            for y, run in bit_runs(bits):
+                fill((255, 255, 255), (x, height - y - run, 1, run))
 
     def print_debug_info(self, cpu: AbstractCPU, target: pygame.Surface) -> None:
-        my_font = pygame.font.Font("space_invaders.ttf", 20)
+        my_font = self.font
+        if my_font is None:
+            my_font = self.font = pygame.font.Font("space_invaders.ttf", 20)
         offset = 500
 
         text_surface = my_font.render(f"PC: 0x{cpu.PC:04X}", False, (0xFF, 0xFF, 0xFF))
         target.blit(text_surface, (30, 0 + offset))
 
-        time_surface = my_font.render(
-            f"FPS: {self.clock.get_fps():.0f}", False, (0xFF, 0xFF, 0xFF)
-        )
+        time_surface = self.render_text(1, f"FPS: {self.clock.get_fps():.0f}")
         target.blit(time_surface, (30, 50 + offset))
 
-        time_surface = my_font.render(
-            f"Time: {self.clock.get_time()}", False, (0xFF, 0xFF, 0xFF)
-        )
+        time_surface = self.render_text(2, f"Time: {self.clock.get_time()}")
         target.blit(time_surface, (30, 100 + offset))
+
+    def render_text(self, line: int, text: str) -> pygame.Surface:
+        """
+        Render the text of a debug line.
+
+        The line is only rendered again when its text differs from the
+        previous frame.
+        """
+        last = self.text_lines.get(line)
+        if last is not None and last[0] == text:
+            return last[1]
+        surface = self.font.render(text, False, (0xFF, 0xFF, 0xFF))
+        self.text_lines[line] = (text, surface)
+        return surface
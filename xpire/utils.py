@@ -3,67 +3,61 @@ Utility functions for the CPU emulator.
 """
 
 
-def reset_value_if_overflow(value: int, max_size: int) -> int:
-    return value & max_size
+def get_ls_nib(value: int) -> int:
+    return value & 0x0F
 
 
-def join_bytes(high_byte: int, low_byte: int) -> int:
-    """
-    Join two bytes into a 16-bit word.
+def get_twos_complement(value: int) -> int:
+    return (value ^ 0xFF) + 0x01
 
-    This method takes two bytes and joins them into a 16-bit word by
-    shifting the high byte left by 8 bits and ORing it with the low byte.
 
-    Returns:
-        int: The joined 16-bit word.
+def bit_runs(bits: int):
     """
-    return (high_byte << 0x08) | low_byte
+    Yield the runs of set bits of an integer, from the least significant.
 
-
-def split_word(word: int) -> tuple[int, int]:
+    Each run is yielded as (start, length), so a line of video memory read
+    as a single integer can be drawn with one fill per run instead of
+    setting its pixels one by one.
     """
-    Split a 16-bit word into two bytes.
-
-    This method takes a 16-bit word and splits it into two bytes: the high byte
-    and the low byte. The high byte is the result of shifting the word right by
-    8 bits and masking the result with 0xFF, and the low byte is the result of
-    masking the word with 0xFF.
-
-    Args:
-        word (int): The 16-bit word to split.
-
-    Returns:
-        tuple[int, int]: A tuple containing the high byte and low byte of the
-        input word.
+    start = 0
+    while bits:
+        skip = (bits & -bits).bit_length() - 1
+        bits >>= skip
+        start += skip
+        length = (~bits & (bits + 1)).bit_length() - 1
+        yield start, length
+        bits >>= length
+        start += length
+
+
+def build_sub_aux_carry_table() -> bytes:
     """
-    return (word >> 0x08) & 0xFF, word & 0xFF
+    Build the auxiliary carry lookup table for subtractions.
 
+    The 8080 subtracts by adding the two's complement of the subtrahend, so
+    the auxiliary carry of a - b only depends on the low nibbles of both
+    operands. The table is indexed with (a & 0x0F) << 4 | (b & 0x0F) and
+    holds the AC bit of the flags byte (0x10) or zero.
 
-def increment_bytes_pair(high_byte: int, low_byte: int) -> tuple[int, int]:
-    """
-    Increment a 16-bit word represented as two bytes by one.
-
-    This method takes two bytes representing a 16-bit word and increments
-    the word by one. The result is returned as a tuple of two bytes: the
-    high byte and the low byte.
+    Returns:
+        bytes: The 256-entry lookup table.
     """
-    value = join_bytes(high_byte, low_byte)
-    value += 0x01
-    value = reset_value_if_overflow(value, 0xFFFF)
-    return split_word(value)
-
-
-def get_ls_nib(value: int) -> int:
-    return value & 0x0F
-
+    table = bytearray(0x100)
+    for a in range(0x10):
+        for b in range(0x10):
+            if a + get_ls_nib(get_twos_complement(b)) > 0x0F:
+                table[(a << 0x04) | b] = 0x10
+    return bytes(table)
 
-def get_ms_nib(value: int) -> int:
-    return (value >> 0x04) & 0x0F
 
+SUB_AUX_CARRY = build_sub_aux_carry_table()
 
-def get_complement_one(value: int) -> int:
-    return value ^ 0xFF
+# Parity bit of the flags byte (0x04) for every byte value with even parity.
+PARITY = bytes(0x04 if (value.bit_count() & 1) == 0 else 0x00 for value in range(0x100))
 
-
-def get_twos_complement(value: int) -> int:
-    return get_complement_one(value) + 0x01
+# Sign (0x80), zero (0x40) and parity (0x04) bits of the flags byte for every
+# byte value, so the three flags of an 8-bit result are a single lookup.
+ZSP = bytes(
+    (value & 0x80) | (0x40 if value == 0x00 else 0x00) | PARITY[value]
+    for value in range(0x100)
+)